@@ -12,6 +12,7 @@ Supports multiple robot types:
 import math
 import time
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 
@@ -105,18 +106,19 @@ class CameraController:
         if not config['has_head']:
             return None, None
 
-        joint_names = list(self.robot.joints.keys())
-        head_pan_idx = None
-        head_tilt_idx = None
-
         pan_name = config.get('pan')
         tilt_name = config.get('tilt')
+        head_pan_idx = None
+        head_tilt_idx = None
 
-        for i, jname in enumerate(joint_names):
+        # Iterating the joints dict yields names in index order; stop once both are found
+        for i, jname in enumerate(self.robot.joints):
             if pan_name and jname == pan_name:
                 head_pan_idx = i
             elif tilt_name and jname == tilt_name:
                 head_tilt_idx = i
+            if head_pan_idx is not None and head_tilt_idx is not None:
+                break
 
         return head_pan_idx, head_tilt_idx
 
@@ -251,7 +253,29 @@ class CameraController:
         self.log("  Camera updated!")
         return obs
 
-    def debug_camera_orientations(self, obs, image_capture, output_dir=None):
+    @staticmethod
+    def _save_image_async(pool, img, path, fast_debug=False):
+        """
+        Encode and write an image on a worker thread.
+
+        PIL releases the GIL while encoding, so the next orientation + settle
+        overlaps with the previous save.
+
+        Args:
+            pool: ThreadPoolExecutor to submit to
+            img: PIL.Image to save
+            path: Target path (suffix replaced with .jpg if fast_debug)
+            fast_debug: Save as JPEG quality=90 instead of PNG
+
+        Returns:
+            (Future, Path) for the pending save
+        """
+        if fast_debug:
+            path = path.with_suffix('.jpg')
+            return pool.submit(img.save, path, quality=90), path
+        return pool.submit(img.save, path), path
+
+    def debug_camera_orientations(self, obs, image_capture, output_dir=None, fast_debug=False):
         """
         Save images from 4 orientations to find best view.
 
@@ -261,6 +285,7 @@ class CameraController:
             obs: Current observation
             image_capture: ImageCapture instance for capturing images
             output_dir: Optional output directory (default: self.debug_dir)
+            fast_debug: Save JPEG instead of PNG (much faster encode)
         """
         config = self._get_robot_config()
 
@@ -285,31 +310,41 @@ class CameraController:
         original_joint_positions = self.robot.get_joint_positions() if head_pan_idx is not None else None
 
         save_dir = output_dir if output_dir else self.debug_dir
-
-        for pan_angle, label in orientations:
-            # Apply orientation
-            if config['has_head'] and head_pan_idx is not None:
-                positions = self.robot.get_joint_positions()
-                positions[head_pan_idx] = pan_angle
-                self.robot.set_joint_positions(positions)
-            elif config.get('use_base_rotation'):
-                self._rotate_base(pan_angle, settle_steps=10)
-            else:
-                continue
-
-            # Step simulation to update rendering
-            for _ in range(30):
-                self.env.step(np.zeros(self.robot.action_dim))
-
-            # Capture image
-            step_result = self.env.step(np.zeros(self.robot.action_dim))
-            obs = step_result[0]
-            img = image_capture.capture_robot_image(obs)
-
-            if img is not None:
-                path = save_dir / f"debug_cam_{ts}_{label}_pan{pan_angle:.2f}.png"
-                img.save(path)
-                self.log(f"    Saved: {path.name}")
+        # The with-block waits for queued saves even if a step/capture raises
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            pending = []
+
+            for pan_angle, label in orientations:
+                # Apply orientation
+                if config['has_head'] and head_pan_idx is not None:
+                    positions = self.robot.get_joint_positions()
+                    positions[head_pan_idx] = pan_angle
+                    self.robot.set_joint_positions(positions)
+                elif config.get('use_base_rotation'):
+                    self._rotate_base(pan_angle, settle_steps=10)
+                else:
+                    continue
+
+                # Step simulation to update rendering
+                for _ in range(30):
+                    self.env.step(np.zeros(self.robot.action_dim))
+
+                # Capture image
+                step_result = self.env.step(np.zeros(self.robot.action_dim))
+                obs = step_result[0]
+                img = image_capture.capture_robot_image(obs)
+
+                if img is not None:
+                    path = save_dir / f"debug_cam_{ts}_{label}_pan{pan_angle:.2f}.png"
+                    pending.append(self._save_image_async(pool, img, path, fast_debug))
+
+            # Wait for pending saves before returning
+            for future, path in pending:
+                try:
+                    future.result()
+                    self.log(f"    Saved: {path.name}")
+                except Exception as e:
+                    self.log(f"    [DEBUG-CAM] Failed to save {path.name}: {e}")
 
         # Restore original orientation
         if config['has_head'] and original_joint_positions is not None:
@@ -355,6 +390,24 @@ class CameraController:
         except Exception:
             pass  # Silently fail - sync is optional
 
+    @staticmethod
+    def _quat_to_yaw(q):
+        """
+        Extract yaw (rotation around Z) from a quaternion.
+
+        Uses atan2(2*(w*z + x*y), w^2 + x^2 - y^2 - z^2), which equals the usual
+        1 - 2*(y^2 + z^2) form for unit quaternions but avoids the cancellation
+        in "1 - ..." for near-singular poses.
+
+        Args:
+            q: Quaternion [x, y, z, w]
+
+        Returns:
+            float: Yaw angle in radians
+        """
+        qx, qy, qz, qw = (float(v) for v in q)
+        return math.atan2(2 * (qw * qz + qx * qy), qw * qw + qx * qx - qy * qy - qz * qz)
+
     def look_at_object(self, obj, tilt_offset=-0.3, settle_steps=20):
         """
         Orient head camera to look at a specific object.
@@ -384,9 +437,7 @@ class CameraController:
             world_angle = math.atan2(dy, dx)
 
             # Get robot's yaw from quaternion
-            # For quaternion [x, y, z, w], yaw = atan2(2*(w*z + x*y), 1 - 2*(y^2 + z^2))
-            qx, qy, qz, qw = robot_ori
-            robot_yaw = math.atan2(2 * (qw * qz + qx * qy), 1 - 2 * (qy * qy + qz * qz))
+            robot_yaw = self._quat_to_yaw(robot_ori)
 
             # Determine pan angle based on robot type
             config = self._get_robot_config()
@@ -449,8 +500,7 @@ class CameraController:
             world_angle = math.atan2(dy, dx)
 
             # Get robot's yaw
-            qx, qy, qz, qw = robot_ori
-            robot_yaw = math.atan2(2 * (qw * qz + qx * qy), 1 - 2 * (qy * qy + qz * qz))
+            robot_yaw = self._quat_to_yaw(robot_ori)
 
             # Determine pan angle based on robot type
             config = self._get_robot_config()
@@ -522,7 +572,8 @@ class CameraController:
             self.log(f"[SCAN] Could not get joint limits: {e}, using defaults")
             return default_pan[0], default_pan[1], default_tilt[0], default_tilt[1]
 
-    def perform_360_scan(self, image_capture, num_angles=8, tilt=-0.3, settle_steps=20):
+    def perform_360_scan(self, image_capture, num_angles=8, tilt=-0.3, settle_steps=20,
+                         fast_debug=False):
         """
         Perform pan sweep within joint limits.
 
@@ -534,6 +585,7 @@ class CameraController:
             num_angles: Number of pan angles to capture (default: 8)
             tilt: Fixed tilt angle during scan (default: -0.3 rad)
             settle_steps: Steps to settle at each angle
+            fast_debug: Save JPEG instead of PNG (much faster encode)
 
         Returns:
             Dict with scan results:
@@ -565,37 +617,60 @@ class CameraController:
 
         self.log(f"[SCAN] Capturing {num_angles} angles from {pan_min:.2f} to {pan_max:.2f} rad...")
 
-        for i, pan in enumerate(angles):
-            # Clamp to limits (defensive)
-            pan_clamped = max(pan_min, min(pan_max, pan))
-            if pan != pan_clamped:
-                self.log(f"[SCAN] Clamped pan {pan:.2f} -> {pan_clamped:.2f}")
-
-            # Orient camera
-            self.orient_camera(head_pan=pan_clamped, head_tilt=tilt, settle_steps=settle_steps)
-
-            # Capture image
-            img = image_capture.capture_validated_screenshot(label=f"scan_{i}")
+        # The with-block waits for queued saves even if orient/capture raises
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            pending = []
+
+            for i, pan in enumerate(angles):
+                # Clamp to limits (defensive)
+                pan_clamped = max(pan_min, min(pan_max, pan))
+                if pan != pan_clamped:
+                    self.log(f"[SCAN] Clamped pan {pan:.2f} -> {pan_clamped:.2f}")
+
+                # Orient camera
+                self.orient_camera(head_pan=pan_clamped, head_tilt=tilt, settle_steps=settle_steps)
+
+                # Capture image
+                img = image_capture.capture_validated_screenshot(label=f"scan_{i}")
+
+                if img:
+                    images.append((pan_clamped, img))
+
+                    # Save individual frame
+                    pan_deg = int(math.degrees(pan_clamped))
+                    path = self.debug_dir / f"scan_{ts}_{i:02d}_pan{pan_deg:+04d}.png"
+                    pending.append(self._save_image_async(pool, img, path, fast_debug))
+                    self.log(f"[SCAN] Frame {i}: pan={pan_clamped:.2f} rad ({pan_deg}deg)")
+
+            # Create contact sheet
+            contact_future = contact_path = None
+            if images:
+                contact_sheet = self._create_contact_sheet(images)
+                contact_future, contact_path = self._save_image_async(
+                    pool, contact_sheet, self.debug_dir / f"scan_{ts}_contact_sheet.png", fast_debug)
+
+            # Wait for pending saves before reporting
+            saved = 0
+            for future, path in pending:
+                try:
+                    future.result()
+                    saved += 1
+                except Exception as e:
+                    self.log(f"[SCAN] Failed to save {path.name}: {e}")
+            if contact_future is not None:
+                try:
+                    contact_future.result()
+                except Exception as e:
+                    self.log(f"[SCAN] Failed to save contact sheet {contact_path.name}: {e}")
+                    contact_path = None
 
-            if img:
-                images.append((pan_clamped, img))
-
-                # Save individual frame
-                pan_deg = int(math.degrees(pan_clamped))
-                path = self.debug_dir / f"scan_{ts}_{i:02d}_pan{pan_deg:+04d}.png"
-                img.save(path)
-                self.log(f"[SCAN] Frame {i}: pan={pan_clamped:.2f} rad ({pan_deg}deg)")
-
-        # Create contact sheet
         if images:
-            contact_sheet = self._create_contact_sheet(images)
-            contact_path = self.debug_dir / f"scan_{ts}_contact_sheet.png"
-            contact_sheet.save(contact_path)
-
-            self.log(f"[SCAN] Saved {len(images)} frames + contact sheet: {contact_path}")
+            if contact_path:
+                self.log(f"[SCAN] Saved {saved} frames + contact sheet: {contact_path}")
+            else:
+                self.log(f"[SCAN] Saved {saved} frames (no contact sheet)")
             self.log("[SCAN] Use --interactive-control to select preferred angle")
         else:
-            contact_path = None
             self.log("[SCAN] No frames captured")
 
         return {
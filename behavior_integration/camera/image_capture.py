@@ -4,13 +4,76 @@ Image Capture
 Capture and validate images from robot camera and external sensors.
 """
 
+import functools
+import math
+import os
 import time
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from PIL import Image
 
 
-def get_robot_camera_image(env, obs, robot_name=None):
+# File format for debug/screenshot images (set DEBUG_IMG_EXT=jpg for faster, lossy output)
+DEBUG_IMG_EXT = os.environ.get('DEBUG_IMG_EXT', 'png').lower().lstrip('.')
+
+# Pixel values / squared values for histogram-based uint8 statistics
+_U8_VALUES = np.arange(256, dtype=np.float64)
+_U8_SQUARES = _U8_VALUES * _U8_VALUES
+
+
+def _frame_mean_std(frame_np):
+    """
+    Compute mean and std of a frame in a single pass.
+
+    uint8 frames are reduced through a 256-bin histogram (one read, no
+    float temporaries); other dtypes fall back to numpy mean/std.
+
+    Args:
+        frame_np: Non-empty numpy array
+
+    Returns:
+        Tuple of (mean, std) as floats
+    """
+    if frame_np.dtype == np.uint8:
+        counts = np.bincount(frame_np.ravel(), minlength=256)
+        n = frame_np.size
+        mean = float(np.dot(counts, _U8_VALUES)) / n
+        var = float(np.dot(counts, _U8_SQUARES)) / n - mean * mean
+        return mean, math.sqrt(max(var, 0.0))
+    return float(frame_np.mean()), float(frame_np.std())
+
+
+@functools.lru_cache(maxsize=None)
+def _zero_action(action_dim):
+    """Shared no-op action vector for settle/warmup steps (read-only)."""
+    action = np.zeros(action_dim)
+    action.setflags(write=False)
+    return action
+
+
+# Key paths already reported by get_robot_camera_image
+_LOGGED_RGB_PATHS = set()
+
+
+def _format_obs_path(path):
+    """Format an obs key path as "['a']['b']['rgb']"."""
+    return "".join(f"['{key}']" for key in path)
+
+
+def _tensor_to_numpy(rgb):
+    """Convert a torch tensor to numpy (zero-copy view for CPU tensors)."""
+    if rgb.device.type == 'cpu':
+        return rgb.detach().numpy()
+    return rgb.detach().contiguous().cpu().numpy()
+
+
+def _array_to_numpy(rgb):
+    """Convert an object exposing .numpy() (e.g. TF/JAX arrays) to numpy."""
+    return rgb.numpy()
+
+
+def get_robot_camera_image(env, obs, robot_name=None, verbose=False):
     """
     Extract RGB image from observation - handles nested OmniGibson structure.
 
@@ -18,25 +81,52 @@ def get_robot_camera_image(env, obs, robot_name=None):
         env: OmniGibson environment
         obs: Observation dict from environment step
         robot_name: Optional robot name override
+        verbose: Print every lookup step (default: only log each new key path once)
 
     Returns:
         RGB array or None
     """
+    rgb, path = find_robot_camera_image(env, obs, robot_name, verbose=verbose)
+    if path is not None and path not in _LOGGED_RGB_PATHS:
+        _LOGGED_RGB_PATHS.add(path)
+        if not verbose:
+            print(f"[Camera] Found RGB at obs{_format_obs_path(path)}")
+    return rgb
+
+
+def find_robot_camera_image(env, obs, robot_name=None, verbose=False):
+    """
+    Extract RGB image from observation along with the key path used.
+
+    Args:
+        env: OmniGibson environment
+        obs: Observation dict from environment step
+        robot_name: Optional robot name override
+        verbose: Print each lookup step (off by default; this runs every warmup step)
+
+    Returns:
+        Tuple of (RGB array or None, tuple of obs keys or None)
+    """
+    def _log(msg):
+        if verbose:
+            print(msg)
+
     rgb = None
+    path = None
 
     # Normalize obs if it's a tuple/list from env.step
     if isinstance(obs, (tuple, list)) and obs:
         obs = obs[0]
     if not hasattr(obs, "items"):
-        print("[Camera] Observation is not a dict; cannot extract RGB")
-        return None
+        _log("[Camera] Observation is not a dict; cannot extract RGB")
+        return None, None
 
     # Find robot name
     if robot_name is None:
         if env.robots:
             robot_name = env.robots[0].name
 
-    print(f"[Camera] Looking for RGB in robot: {robot_name}")
+    _log(f"[Camera] Looking for RGB in robot: {robot_name}")
 
     # OmniGibson structure: obs[robot_name][camera_key]['rgb']
     if robot_name and robot_name in obs:
@@ -45,33 +135,38 @@ def get_robot_camera_image(env, obs, robot_name=None):
         # Direct rgb key
         if 'rgb' in robot_obs:
             rgb = robot_obs['rgb']
-            print(f"[Camera] Found RGB at obs[{robot_name}]['rgb']")
+            path = (robot_name, 'rgb')
+            _log(f"[Camera] Found RGB at obs[{robot_name}]['rgb']")
         else:
             # Search camera sensors
             for sensor_key, sensor_data in robot_obs.items():
                 if 'Camera' in sensor_key or 'camera' in sensor_key.lower():
                     if isinstance(sensor_data, dict) and 'rgb' in sensor_data:
                         rgb = sensor_data['rgb']
-                        print(f"[Camera] Found RGB at obs[{robot_name}]['{sensor_key}']['rgb']")
+                        path = (robot_name, sensor_key, 'rgb')
+                        _log(f"[Camera] Found RGB at obs[{robot_name}]['{sensor_key}']['rgb']")
                         break
                     elif hasattr(sensor_data, 'shape'):
                         rgb = sensor_data
-                        print(f"[Camera] Found RGB array at obs[{robot_name}]['{sensor_key}']")
+                        path = (robot_name, sensor_key)
+                        _log(f"[Camera] Found RGB array at obs[{robot_name}]['{sensor_key}']")
                         break
 
     # Fallback: search top level
     if rgb is None:
-        print("[Camera] Trying fallback search in top-level obs...")
+        _log("[Camera] Trying fallback search in top-level obs...")
         for k, v in obs.items():
             if isinstance(v, dict):
                 if 'rgb' in v:
                     rgb = v['rgb']
-                    print(f"[Camera] Found RGB at obs['{k}']['rgb']")
+                    path = (k, 'rgb')
+                    _log(f"[Camera] Found RGB at obs['{k}']['rgb']")
                     break
                 for sub_k, sub_v in v.items():
                     if 'Camera' in sub_k and isinstance(sub_v, dict) and 'rgb' in sub_v:
                         rgb = sub_v['rgb']
-                        print(f"[Camera] Found RGB at obs['{k}']['{sub_k}']['rgb']")
+                        path = (k, sub_k, 'rgb')
+                        _log(f"[Camera] Found RGB at obs['{k}']['{sub_k}']['rgb']")
                         break
                 if rgb is not None:
                     break
@@ -79,11 +174,47 @@ def get_robot_camera_image(env, obs, robot_name=None):
     if rgb is not None:
         # Log info
         if hasattr(rgb, 'shape'):
-            print(f"[Camera] RGB shape: {rgb.shape}, dtype: {rgb.dtype}")
+            _log(f"[Camera] RGB shape: {rgb.shape}, dtype: {rgb.dtype}")
     else:
-        print("[Camera] RGB not found in observation!")
+        _log("[Camera] RGB not found in observation!")
 
-    return rgb
+    return rgb, path
+
+
+# Reasons indexed by the code returned from _classify_frame_stats (0 = valid)
+_FRAME_REASONS = (
+    '',
+    'BLACK FRAME (mean < 10)',
+    'OVEREXPOSED (mean > 250)',
+    'NO DETAIL (std < 15)',
+)
+
+
+def _classify_frame_stats(mean, std):
+    """
+    Classify frame statistics against the validation thresholds.
+
+    Valid frames are not black (mean >= 10), not white (mean <= 250) and
+    have detail (std >= 15).
+
+    Returns:
+        int: 0 if valid, else an index into _FRAME_REASONS
+    """
+    if mean < 10:
+        return 1
+    if mean > 250:
+        return 2
+    if std < 15:
+        return 3
+    return 0
+
+
+def _is_scene_ready(scene):
+    """Check that the scene is loaded, initialized and has objects."""
+    if not (getattr(scene, "loaded", True) and getattr(scene, "initialized", True)):
+        return False
+    objects = getattr(scene, "objects", None)
+    return objects is not None and len(objects) > 0
 
 
 def wait_for_scene_ready(env, max_steps=60):
@@ -99,23 +230,28 @@ def wait_for_scene_ready(env, max_steps=60):
     """
     print("Waiting for scene to load and render...")
     obs = None
+    zero_action = _zero_action(env.robots[0].action_dim)
+    scene = env.scene
+    render = getattr(env, "render", None)
+
+    # Readiness is re-checked on a backoff schedule (steps 1, 2, 4, 8, then every 8)
+    next_check = 0
+    check_interval = 1
     for i in range(max_steps):
-        step_result = env.step(np.zeros(env.robots[0].action_dim))
+        step_result = env.step(zero_action)
         obs = step_result[0]
-        if hasattr(env, "render"):
+        if render is not None:
             try:
-                env.render()
+                render()
             except Exception:
                 pass
 
-        scene_loaded = getattr(env.scene, "loaded", True)
-        scene_initialized = getattr(env.scene, "initialized", True)
-        scene_has_objects = hasattr(env.scene, "objects") and len(env.scene.objects) > 0
-        if scene_loaded and scene_initialized and scene_has_objects:
-            rgb = get_robot_camera_image(env, obs)
-            if rgb is not None:
+        if i == next_check:
+            if _is_scene_ready(scene) and get_robot_camera_image(env, obs) is not None:
                 print(f"Scene ready after {i + 1} steps")
                 return obs
+            next_check = i + check_interval
+            check_interval = min(8, check_interval * 2)
 
         if i % 10 == 0:
             print(f"  Warmup step {i + 1}/{max_steps}")
@@ -147,6 +283,17 @@ class ImageCapture:
         self.log = log_fn
         self.debug_dir = Path(debug_dir) if debug_dir else Path("debug_images")
         self.debug_dir.mkdir(exist_ok=True)
+        self._u8_buf = None  # Reused float->uint8 conversion buffer
+        self._to_np_cache = {np.ndarray: np.asarray}  # type(rgb) -> numpy converter
+        self._rgb_path = None  # Cached obs key path to the head RGB
+        self._rgb_path_env = None  # Env the cached path was resolved against
+        self._debug_ext = DEBUG_IMG_EXT
+        if self._debug_ext in ('jpg', 'jpeg'):
+            self._debug_save_kwargs = {'quality': 90, 'optimize': False}
+        elif self._debug_ext == 'png':
+            self._debug_save_kwargs = {'compress_level': 1}
+        else:
+            self._debug_save_kwargs = {}
 
     @property
     def env(self):
@@ -171,24 +318,83 @@ class ImageCapture:
         if rgb is None:
             return None
 
-        # Convert to numpy
-        if hasattr(rgb, 'cpu'):
-            rgb_np = rgb.cpu().numpy()
-        elif hasattr(rgb, 'numpy'):
-            rgb_np = rgb.numpy()
-        else:
-            rgb_np = np.asarray(rgb)
+        return self._u8_to_pil(self._to_u8_ndarray(rgb))
 
-        # Normalize to uint8
-        if rgb_np.max() <= 1.0 and rgb_np.dtype != np.uint8:
-            rgb_np = (rgb_np * 255).astype(np.uint8)
+    def _to_u8_ndarray(self, rgb):
+        """
+        Convert rgb tensor/array to a uint8 RGB ndarray.
+
+        The result may alias the reused conversion buffer, so turn it into a
+        PIL image (which copies) before the next capture.
+
+        Args:
+            rgb: RGB data (tensor, numpy array, or array-like)
+
+        Returns:
+            numpy array (uint8 for float/uint8 inputs)
+        """
+        rgb_np = self._to_numpy(rgb)
 
-        # Handle RGBA -> RGB if needed
-        if len(rgb_np.shape) == 3 and rgb_np.shape[2] == 4:
-            rgb_np = rgb_np[:, :, :3]
+        # Normalize [0, 1] floats to uint8 (dtype decides; a sparse sample guards
+        # against floats already in [0, 255] without scanning the whole frame)
+        if rgb_np.dtype.kind == 'f' and rgb_np.flat[::4096].max() <= 1.0:
+            rgb_np = self._scale_to_u8(rgb_np)
 
+        # Handle RGBA -> RGB if needed (contiguous so PIL skips its strided copy path)
+        if rgb_np.ndim == 3 and rgb_np.shape[2] == 4:
+            rgb_np = np.ascontiguousarray(rgb_np[:, :, :3])
+
+        return rgb_np
+
+    @staticmethod
+    def _u8_to_pil(rgb_np):
+        """
+        Build a PIL Image from an ndarray produced by _to_u8_ndarray.
+
+        Contiguous uint8 RGB goes straight to Image.frombuffer, skipping
+        fromarray's array-interface inspection. PIL stores RGB as 4 bytes per
+        pixel, so this is a single unpack copy and the image never aliases
+        rgb_np (safe with the reused conversion buffer).
+        """
+        if rgb_np.ndim == 3 and rgb_np.shape[2] == 3 and rgb_np.dtype == np.uint8:
+            if rgb_np.flags.c_contiguous:
+                height, width = rgb_np.shape[:2]
+                return Image.frombuffer('RGB', (width, height), rgb_np, 'raw', 'RGB', 0, 1)
+            return Image.fromarray(rgb_np, mode='RGB')
         return Image.fromarray(rgb_np)
 
+    def _to_numpy(self, rgb):
+        """
+        Convert rgb tensor/array to numpy.
+
+        The converter is resolved once per input type and cached, so the
+        hasattr() probing only runs the first time a type is seen.
+        """
+        rgb_type = type(rgb)
+        conv = self._to_np_cache.get(rgb_type)
+        if conv is None:
+            if hasattr(rgb, 'cpu') and hasattr(rgb, 'device'):
+                conv = _tensor_to_numpy
+            elif hasattr(rgb, 'numpy'):
+                conv = _array_to_numpy
+            else:
+                conv = np.asarray
+            self._to_np_cache[rgb_type] = conv
+        return conv(rgb)
+
+    def _scale_to_u8(self, rgb_np):
+        """
+        Scale a [0, 1] float array to uint8 in a single fused pass.
+
+        Writes into a buffer reused across calls (reallocated on shape change),
+        so callers must not hold on to the result across captures.
+        """
+        buf = self._u8_buf
+        if buf is None or buf.shape != rgb_np.shape:
+            buf = self._u8_buf = np.empty(rgb_np.shape, dtype=np.uint8)
+        np.multiply(rgb_np, 255, out=buf, casting='unsafe')
+        return buf
+
     def _get_robot_camera_image(self, obs):
         """
         Extract RGB image from robot observation.
@@ -199,7 +405,27 @@ class ImageCapture:
         Returns:
             RGB array or None
         """
-        return get_robot_camera_image(self.env, obs)
+        env = self.env
+        if isinstance(obs, (tuple, list)) and obs:
+            obs = obs[0]
+
+        # Fast path: direct lookup along the previously resolved key path
+        path = self._rgb_path
+        if path is not None and self._rgb_path_env is env:
+            try:
+                rgb = obs
+                for key in path:
+                    rgb = rgb[key]
+                return rgb
+            except (KeyError, TypeError, IndexError):
+                pass
+
+        rgb, path = find_robot_camera_image(env, obs)
+        if path is not None and path != self._rgb_path:
+            self.log(f"[Camera] Found RGB at obs{_format_obs_path(path)}")
+        self._rgb_path = path
+        self._rgb_path_env = env if path is not None else None
+        return rgb
 
     def capture_robot_image(self, obs):
         """
@@ -214,47 +440,63 @@ class ImageCapture:
         rgb = self._get_robot_camera_image(obs)
         return self._to_pil_image(rgb)
 
-    def capture_image(self, obs, max_attempts=30):
+    def _fresh_obs(self, advance_sim=True):
+        """
+        Get a fresh observation.
+
+        Args:
+            advance_sim: Step physics with a zero action (True) or only
+                render and read sensors via env.get_obs() (False)
+
+        Returns:
+            Observation dict
+        """
+        if advance_sim:
+            return self.env.step(_zero_action(self.robot.action_dim))[0]
+
+        render = getattr(self.env, 'render', None)
+        if render is not None:
+            try:
+                render()
+            except Exception:
+                pass
+        obs = self.env.get_obs()
+        if isinstance(obs, tuple):
+            obs = obs[0]
+        return obs
+
+    def capture_image(self, obs, max_attempts=30, advance_sim=True):
         """
         Capture and validate RGB image from robot camera with retries.
 
         Args:
             obs: Initial observation
             max_attempts: Maximum capture attempts
+            advance_sim: Step physics between attempts (False = render only)
 
         Returns:
             Tuple of (PIL Image or None, updated observation)
         """
         for attempt in range(max_attempts):
-            step_result = self.env.step(np.zeros(self.robot.action_dim))
-            obs = step_result[0]
+            obs = self._fresh_obs(advance_sim)
 
             rgb = self._get_robot_camera_image(obs)
             if rgb is None:
                 continue
 
-            # Convert to numpy
-            if hasattr(rgb, 'cpu'):
-                rgb_np = rgb.cpu().numpy()
-            elif hasattr(rgb, 'numpy'):
-                rgb_np = rgb.numpy()
-            else:
-                rgb_np = np.asarray(rgb)
-
-            if rgb_np.max() <= 1.0 and rgb_np.dtype != np.uint8:
-                rgb_np = (rgb_np * 255).astype(np.uint8)
+            rgb_np = self._to_u8_ndarray(rgb)
 
             # Validate
             if rgb_np.shape[0] < 100 or rgb_np.shape[1] < 100:
                 continue
 
-            mean_val = rgb_np.mean()
-            std_val = rgb_np.std()
+            # Reject on a strided subsample; black/overexposed frames show up at 1/64 density
+            mean_val, std_val = _frame_mean_std(rgb_np[::8, ::8])
 
             if mean_val < 5 or mean_val > 250 or std_val < 10:
                 continue
 
-            return Image.fromarray(rgb_np), obs
+            return self._u8_to_pil(rgb_np), obs
 
         self.log("Warning: Could not capture valid image")
         return None, obs
@@ -270,11 +512,12 @@ class ImageCapture:
         Returns:
             PIL Image or None
         """
+        zero_action = _zero_action(self.robot.action_dim)
         for attempt in range(max_attempts):
             try:
                 # Run some steps to stabilize rendering
                 for _ in range(5):
-                    self.env.step(np.zeros(self.robot.action_dim))
+                    self.env.step(zero_action)
 
                 final_obs = self.env.get_obs()
                 rgb = self._get_robot_camera_image(final_obs)
@@ -283,25 +526,20 @@ class ImageCapture:
                     self.log(f"  [{label}] attempt {attempt+1}: rgb is None")
                     continue
 
-                img = self._to_pil_image(rgb)
-                if img is None:
-                    continue
+                # Validate on the ndarray; only build the PIL image on success
+                rgb_np = self._to_u8_ndarray(rgb)
 
-                rgb_np = np.asarray(img)
-
-                # Validate
                 if rgb_np.shape[0] < 100 or rgb_np.shape[1] < 100:
                     self.log(f"  [{label}] attempt {attempt+1}: too small {rgb_np.shape}")
                     continue
 
-                mean_val = rgb_np.mean()
-                std_val = rgb_np.std()
+                mean_val, std_val = _frame_mean_std(rgb_np[::8, ::8])
 
                 if mean_val < 5 or mean_val > 250 or std_val < 10:
                     self.log(f"  [{label}] attempt {attempt+1}: invalid (mean={mean_val:.1f}, std={std_val:.1f})")
                     continue
 
-                return img
+                return self._u8_to_pil(rgb_np)
 
             except Exception as e:
                 self.log(f"  [{label}] attempt {attempt+1} error: {e}")
@@ -355,21 +593,31 @@ class ImageCapture:
             self.log(f"  Could not capture external sensors: {e}")
 
         # Save all views (if prefix provided)
-        if prefix:
+        # Sensor reads stay serial (renderer is not thread-safe); image encoding
+        # releases the GIL, so the saves run in parallel.
+        if prefix and views:
             save_dir = output_dir if output_dir else self.debug_dir
-            for view_name, img in views.items():
-                path = save_dir / f"{prefix}_{view_name}.png"
-                img.save(path)
-                self.log(f"  Saved {view_name} view: {path.name}")
+            pending = []
+            with ThreadPoolExecutor(max_workers=min(4, len(views))) as pool:
+                for view_name, img in views.items():
+                    path = save_dir / f"{prefix}_{view_name}.{self._debug_ext}"
+                    pending.append((view_name, path, pool.submit(img.save, path, **self._debug_save_kwargs)))
+            for view_name, path, future in pending:
+                try:
+                    future.result()
+                    self.log(f"  Saved {view_name} view: {path.name}")
+                except Exception as e:
+                    self.log(f"  Could not save {view_name} view: {e}")
 
         return views
 
-    def take_screenshot(self, prefix="screenshot"):
+    def take_screenshot(self, prefix="screenshot", advance_sim=True):
         """
         Take and save a single screenshot (convenience method for interactive mode).
 
         Args:
             prefix: Filename prefix
+            advance_sim: Step physics before capturing (False = render only)
 
         Returns:
             Tuple of (PIL Image or None, current observation)
@@ -377,15 +625,14 @@ class ImageCapture:
         ts = time.strftime("%Y%m%d_%H%M%S")
 
         # Capture image
-        step_result = self.env.step(np.zeros(self.robot.action_dim))
-        current_obs = step_result[0]
+        current_obs = self._fresh_obs(advance_sim)
         rgb = self._get_robot_camera_image(current_obs)
 
         if rgb is not None:
             img = self._to_pil_image(rgb)
             if img:
-                path = self.debug_dir / f"{prefix}_{ts}.png"
-                img.save(path)
+                path = self.debug_dir / f"{prefix}_{ts}.{self._debug_ext}"
+                img.save(path, **self._debug_save_kwargs)
                 self.log(f"  Screenshot saved: {path.name}")
                 return img, current_obs
 
@@ -441,22 +688,67 @@ class ImageCapture:
             return result
 
         # Calculate statistics
-        result['mean'] = float(frame_np.mean())
-        result['std'] = float(frame_np.std())
+        result['mean'], result['std'] = _frame_mean_std(frame_np)
+        return self._check_frame_stats(result)
+
+    @staticmethod
+    def _check_frame_stats(result):
+        """Apply brightness/detail thresholds to a validation result dict."""
+        code = _classify_frame_stats(result['mean'], result['std'])
+        if code:
+            result['reason'] = _FRAME_REASONS[code]
+        else:
+            result['valid'] = True
+        return result
 
-        # Validate: not black (mean > 10), not white (mean < 250), has detail (std > 15)
-        if result['mean'] < 10:
-            result['reason'] = 'BLACK FRAME (mean < 10)'
-            return result
-        if result['mean'] > 250:
-            result['reason'] = 'OVEREXPOSED (mean > 250)'
-            return result
-        if result['std'] < 15:
-            result['reason'] = 'NO DETAIL (std < 15)'
+    def validate_views(self, views):
+        """
+        Validate multiple views as one pooled frame without building a composite.
+
+        Per-view statistics are combined analytically:
+        mean = sum(n_i * mean_i) / N, var = sum(n_i * (var_i + mean_i^2)) / N - mean^2
+
+        Args:
+            views: Dict of view_name -> PIL Image or numpy array
+
+        Returns:
+            Dict with the same keys as validate_frame; 'resolution' is the
+            (total width, max height) of the views placed side by side
+        """
+        result = {
+            'valid': False,
+            'mean': 0.0,
+            'std': 0.0,
+            'resolution': (0, 0),
+            'reason': ''
+        }
+
+        total_n = 0
+        sum_mean = 0.0
+        sum_sq = 0.0
+        width = 0
+        height = 0
+        for frame in views.values():
+            frame_np = np.asarray(frame) if isinstance(frame, Image.Image) else frame
+            if frame_np is None or frame_np.ndim < 2 or frame_np.size == 0:
+                continue
+            mean_i, std_i = _frame_mean_std(frame_np)
+            n_i = frame_np.size
+            total_n += n_i
+            sum_mean += n_i * mean_i
+            sum_sq += n_i * (std_i * std_i + mean_i * mean_i)
+            width += frame_np.shape[1]
+            height = max(height, frame_np.shape[0])
+
+        if total_n == 0:
+            result['reason'] = 'no valid views'
             return result
 
-        result['valid'] = True
-        return result
+        mean = sum_mean / total_n
+        result['mean'] = mean
+        result['std'] = math.sqrt(max(sum_sq / total_n - mean * mean, 0.0))
+        result['resolution'] = (width, height)
+        return self._check_frame_stats(result)
 
     def get_observation_path(self, obs):
         """
@@ -536,9 +828,8 @@ class ImageCapture:
         if multi_view:
             views = self.capture_all_views(obs, og, prefix="")
             if views:
-                # Create composite for validation
-                composite_img = self._create_composite_for_validation(views)
-                composite_validation = self.validate_frame(composite_img, "composite")
+                # Pool per-view statistics (no composite image needed)
+                composite_validation = self.validate_views(views)
                 result['composite'] = composite_validation
 
                 if composite_validation['valid']:
@@ -553,51 +844,3 @@ class ImageCapture:
         result['passed'] = True
         self.log("[SANITY] Frame capture validated, proceeding with video recording")
         return result
-
-    def _create_composite_for_validation(self, views):
-        """
-        Create a simple composite image for validation.
-
-        Args:
-            views: Dict of view_name -> PIL Image
-
-        Returns:
-            PIL Image (composite)
-        """
-        if not views:
-            return None
-
-        cell_size = 512
-        view_order = ['birds_eye', 'front_view', 'follow_cam', 'head']
-        ordered = [(n, views[n]) for n in view_order if n in views]
-
-        # Add any remaining views
-        for n, img in views.items():
-            if n not in view_order:
-                ordered.append((n, img))
-
-        if not ordered:
-            return None
-
-        n_views = len(ordered)
-        if n_views <= 2:
-            cols, rows = 2, 1
-        elif n_views <= 4:
-            cols, rows = 2, 2
-        else:
-            cols, rows = 3, 2
-
-        composite = Image.new('RGB', (cell_size * cols, cell_size * rows), (30, 30, 30))
-
-        for idx, (name, img) in enumerate(ordered[:cols * rows]):
-            row = idx // cols
-            col = idx % cols
-
-            # Resize to cell size
-            img_resized = img.resize((cell_size, cell_size), Image.Resampling.LANCZOS)
-
-            x = col * cell_size
-            y = row * cell_size
-            composite.paste(img_resized, (x, y))
-
-        return composite
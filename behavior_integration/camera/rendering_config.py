@@ -61,6 +61,29 @@ RENDER_PRESETS = {
 }
 
 
+# Settings that do not depend on the preset or CLI overrides
+_STATIC_RTX_SETTINGS = (
+    # Lighting quality
+    ("/rtx/reflections/enabled", True),
+    ("/rtx/indirectDiffuse/enabled", True),
+    ("/rtx/ambientOcclusion/enabled", True),
+    ("/rtx/directLighting/sampledLighting/enabled", True),
+    # Firefly filter to reduce bright pixel noise
+    ("/rtx/pathtracing/fireflyFilter/maxIntensityPerSample", 10000),
+    ("/rtx/pathtracing/fireflyFilter/maxIntensityPerSampleDiffuse", 50000),
+    # Semantic schema for object detection
+    ("/rtx/hydra/enableSemanticSchema", True),
+)
+
+
+def _first_not_none(*values):
+    """Return the first value that is not None (None if all are)."""
+    for value in values:
+        if value is not None:
+            return value
+    return None
+
+
 def configure_rtx_rendering(settings, args, is_headless=False, log_fn=print):
     """
     Configure RTX settings for quality rendering with denoising.
@@ -73,92 +96,63 @@ def configure_rtx_rendering(settings, args, is_headless=False, log_fn=print):
         log_fn: Logging function (default: print)
     """
     preset = RENDER_PRESETS.get(args.render_quality, RENDER_PRESETS["balanced"])
+    cli_width = getattr(args, 'width', None)
+    cli_height = getattr(args, 'height', None)
 
     # CLI overrides with preset fallbacks
     # SPP: check --spp first, then --samples-per-pixel, then preset
     spp = getattr(args, 'spp', None) or getattr(args, 'samples_per_pixel', None) or preset["samples_per_pixel"]
-
-    # Denoiser blend: CLI override or preset
-    denoiser_blend = getattr(args, 'denoiser_blend', None)
-    if denoiser_blend is None:
-        denoiser_blend = preset["denoiser_blend"]
-
-    # TAA: CLI override or preset
-    taa_enabled = getattr(args, 'taa', None)
-    if taa_enabled is None:
-        taa_enabled = preset.get("taa_enabled", True)
-
-    # Render mode: CLI override or preset
+    # denoiser_blend: 0.0 = full denoiser (smooth/blur), 1.0 = no denoiser (noise)
+    denoiser_blend = _first_not_none(getattr(args, 'denoiser_blend', None), preset["denoiser_blend"])
+    taa_enabled = _first_not_none(getattr(args, 'taa', None), preset.get("taa_enabled", True))
     render_mode = getattr(args, 'render_mode', None) or preset.get("render_mode", "PathTracing")
-
-    # Resolution: CLI width/height override or preset
-    width = getattr(args, 'width', None) or preset.get("resolution", 512)
-    height = getattr(args, 'height', None) or preset.get("resolution", 512)
-
+    width = cli_width or preset.get("resolution", 512)
+    height = cli_height or preset.get("resolution", 512)
     max_bounces = preset["max_bounces"]
+    sharpen = "sharp" in args.render_quality
 
     # Log all effective values upfront
     log_fn(f"[RTX] Effective settings: spp={spp}, denoiser_blend={denoiser_blend}, "
            f"taa={taa_enabled}, mode={render_mode}, resolution={width}x{height}")
 
-    # Resolution
-    if is_headless:
-        settings.set("/app/renderer/resolution/width", width)
-        settings.set("/app/renderer/resolution/height", height)
-    else:
-        # In GUI mode, use CLI overrides if provided, else fixed 1280x720
-        gui_width = getattr(args, 'width', None) or 1280
-        gui_height = getattr(args, 'height', None) or 720
-        settings.set("/app/renderer/resolution/width", gui_width)
-        settings.set("/app/renderer/resolution/height", gui_height)
-
-    # Render mode - RayTracedLighting is much faster, PathTracing for quality
-    settings.set("/rtx/rendermode", render_mode)
-    log_fn(f"[RTX] Render mode: {render_mode}")
-
-    # Anti-aliasing (TAA) - can cause blur/ghosting when enabled
-    # 0 = off, 1 = FXAA, 2 = TAA, 3 = DLAA
-    if taa_enabled:
-        settings.set("/rtx/post/aa/op", 2)  # TAA
-        log_fn("[RTX] TAA anti-aliasing: enabled")
-    else:
-        settings.set("/rtx/post/aa/op", 0)  # Disabled for sharper image
-        log_fn("[RTX] TAA anti-aliasing: disabled (sharper)")
-
-    # DENOISER - key for removing noise!
-    # denoiser_blend: 0.0 = full denoiser (smooth/blur), 1.0 = no denoiser (noise)
+    # In GUI mode, use CLI overrides if provided, else fixed 1280x720
+    if not is_headless:
+        width = cli_width or 1280
+        height = cli_height or 720
+
+    rtx_settings = [
+        ("/app/renderer/resolution/width", width),
+        ("/app/renderer/resolution/height", height),
+        # Render mode - RayTracedLighting is much faster, PathTracing for quality
+        ("/rtx/rendermode", render_mode),
+        # Anti-aliasing: 0 = off, 1 = FXAA, 2 = TAA, 3 = DLAA (TAA can cause blur/ghosting)
+        ("/rtx/post/aa/op", 2 if taa_enabled else 0),
+        ("/rtx/pathtracing/optixDenoiser/enabled", bool(args.enable_denoiser)),
+    ]
     if args.enable_denoiser:
-        settings.set("/rtx/pathtracing/optixDenoiser/enabled", True)
-        settings.set("/rtx/pathtracing/optixDenoiser/blendFactor", denoiser_blend)
-        log_fn(f"[RTX] OptiX denoiser enabled (blend: {denoiser_blend}, higher=sharper)")
-    else:
-        settings.set("/rtx/pathtracing/optixDenoiser/enabled", False)
-        log_fn("[RTX] Denoiser disabled")
-
-    # Samples per pixel (higher = less noise, allows less aggressive denoising)
-    settings.set("/rtx/pathtracing/spp", spp)
-    settings.set("/rtx/pathtracing/totalSpp", spp)
-    log_fn(f"[RTX] Samples per pixel: {spp}")
-
-    # Lighting quality
-    settings.set("/rtx/pathtracing/maxBounces", max_bounces)
-    settings.set("/rtx/reflections/enabled", True)
-    settings.set("/rtx/indirectDiffuse/enabled", True)
-    settings.set("/rtx/ambientOcclusion/enabled", True)
-    settings.set("/rtx/directLighting/sampledLighting/enabled", True)
-
-    # Firefly filter to reduce bright pixel noise
-    settings.set("/rtx/pathtracing/fireflyFilter/maxIntensityPerSample", 10000)
-    settings.set("/rtx/pathtracing/fireflyFilter/maxIntensityPerSampleDiffuse", 50000)
-
-    # Sharpening post-process (helps counter denoiser blur)
-    # Only for sharp presets
-    if "sharp" in args.render_quality:
-        settings.set("/rtx/post/sharpen/enabled", True)
-        settings.set("/rtx/post/sharpen/intensity", 0.3)
-        log_fn("[RTX] Post-process sharpening: enabled (0.3)")
-
-    # Semantic schema for object detection
-    settings.set("/rtx/hydra/enableSemanticSchema", True)
-
+        rtx_settings.append(("/rtx/pathtracing/optixDenoiser/blendFactor", denoiser_blend))
+    rtx_settings += [
+        # Samples per pixel (higher = less noise, allows less aggressive denoising)
+        ("/rtx/pathtracing/spp", spp),
+        ("/rtx/pathtracing/totalSpp", spp),
+        ("/rtx/pathtracing/maxBounces", max_bounces),
+    ]
+    rtx_settings += _STATIC_RTX_SETTINGS
+    # Sharpening post-process (helps counter denoiser blur), only for sharp presets
+    if sharpen:
+        rtx_settings += [
+            ("/rtx/post/sharpen/enabled", True),
+            ("/rtx/post/sharpen/intensity", 0.3),
+        ]
+
+    for path, value in rtx_settings:
+        settings.set(path, value)
+
+    denoiser_msg = (f"OptiX denoiser enabled (blend: {denoiser_blend}, higher=sharper)"
+                    if args.enable_denoiser else "Denoiser disabled")
+    log_fn(f"[RTX] Render mode: {render_mode}\n"
+           f"[RTX] TAA anti-aliasing: {'enabled' if taa_enabled else 'disabled (sharper)'}\n"
+           f"[RTX] {denoiser_msg}\n"
+           f"[RTX] Samples per pixel: {spp}"
+           + ("\n[RTX] Post-process sharpening: enabled (0.3)" if sharpen else ""))
     log_fn(f"[RTX] Rendering configured: preset={args.render_quality}, spp={spp}, bounces={max_bounces}")
@@ -5,6 +5,7 @@ Infers task-relevant objects for camera targeting with explicit source tracking.
 Uses a priority cascade: BDDL goals -> task map -> keywords -> none.
 """
 
+from bisect import bisect_right
 from typing import List, Optional, Dict, Any
 
 
@@ -56,6 +57,73 @@ KEYWORD_MAPPINGS = {
 }
 
 
+# Lowercased views of the maps above, built once at import
+TASK_TARGET_MAP_LOWER = {
+    task: tuple(cat.lower() for cat in cats) for task, cats in TASK_TARGET_MAP.items()
+}
+KEYWORD_MAPPINGS_LOWER = tuple(
+    (keyword.lower(), tuple(t.lower() for t in types)) for keyword, types in KEYWORD_MAPPINGS.items()
+)
+
+
+class _SceneIndex:
+    """
+    Substring search over scene object names/categories.
+
+    All entries are joined into one "name\tcategory\n" string so a lookup is
+    a C-level str.find instead of a Python loop over every object. Needles
+    never contain tab/newline, so a match cannot span two fields.
+    """
+
+    def __init__(self, entries: list):
+        """
+        Args:
+            entries: List of (obj, name_lower, category_lower)
+        """
+        self.entries = entries
+        self.starts = []  # Offset of each entry's line in haystack
+        parts = []
+        offset = 0
+        for _, name, category in entries:
+            self.starts.append(offset)
+            line = f"{name}\t{category}\n"
+            parts.append(line)
+            offset += len(line)
+        self.haystack = ''.join(parts)
+
+    def first_match(self, needle: str, seen: set) -> Optional[tuple]:
+        """First entry (in scene order) whose name or category contains needle, skipping id(obj) in seen."""
+        find = self.haystack.find
+        starts = self.starts
+        pos = find(needle)
+        while pos != -1:
+            i = bisect_right(starts, pos) - 1
+            entry = self.entries[i]
+            if id(entry[0]) not in seen:
+                return entry
+            if i + 1 == len(starts):
+                break
+            pos = find(needle, starts[i + 1])
+        return None
+
+    def matches_any(self, needles, seen: set) -> list:
+        """All entries (in scene order) containing any of needles, skipping id(obj) in seen."""
+        find = self.haystack.find
+        starts = self.starts
+        last = len(starts) - 1
+        hits = set()
+        for needle in needles:
+            pos = find(needle)
+            while pos != -1:
+                i = bisect_right(starts, pos) - 1
+                hits.add(i)
+                if i == last:
+                    break
+                pos = find(needle, starts[i + 1])
+        entries = self.entries
+        return [entries[i] for i in sorted(hits) if id(entries[i][0]) not in seen]
+
+
 class TargetInference:
     """
     Infers task-relevant objects with explicit source tracking.
@@ -100,22 +168,32 @@ class TargetInference:
         """
         scene_objects = list(self.env.scene.objects) if self.env and hasattr(self.env, 'scene') else []
 
+        # Lowercase names/categories once; helpers scan this list instead of
+        # re-reading and re-lowering object attributes per target
+        scene_entries = [
+            (obj, getattr(obj, 'name', '').lower(), getattr(obj, 'category', '').lower())
+            for obj in scene_objects
+        ]
+
         # 1. Try BDDL goal predicates (if available)
         self.log("[TARGET] Attempting BDDL goal parsing...")
-        bddl_result = self._try_bddl_goals(task_name, scene_objects, max_targets)
+        bddl_result = self._try_bddl_goals(task_name, scene_entries, max_targets)
         if bddl_result['targets']:
             return bddl_result
 
+        # Later stages search by substring; index the scene once for both
+        scene_index = _SceneIndex(scene_entries)
+
         # 2. Try manual task-targets map
         self.log("[TARGET] No BDDL goals accessible, trying task map...")
-        map_result = self._try_task_map(task_name, scene_objects, max_targets)
+        map_result = self._try_task_map(task_name, scene_index, max_targets)
         if map_result['targets']:
             return map_result
 
         # 3. Try keyword heuristic
         if instruction:
             self.log("[TARGET] Task map failed, trying keyword heuristic...")
-            keyword_result = self._try_keyword_heuristic(instruction, scene_objects, max_targets)
+            keyword_result = self._try_keyword_heuristic(instruction, scene_index, max_targets)
             if keyword_result['targets']:
                 return keyword_result
 
@@ -130,13 +208,14 @@ class TargetInference:
     def _try_bddl_goals(
         self,
         task_name: str,
-        scene_objects: list,
+        scene_entries: list,
         max_targets: int
     ) -> Dict[str, Any]:
         """
         Try to extract target objects from BDDL goal conditions.
 
         Attempts to access goal conditions from the environment's task.
+        scene_entries is a list of (obj, name_lower, category_lower).
         """
         result = {'targets': [], 'source': 'bddl', 'details': ''}
 
@@ -161,7 +240,7 @@ class TargetInference:
         try:
             target_names = self._parse_goal_conditions(goal_conds)
             if target_names:
-                targets = self._find_objects_by_names(target_names, scene_objects, max_targets)
+                targets = self._find_objects_by_names(target_names, scene_entries, max_targets)
                 if targets:
                     result['targets'] = targets
                     result['details'] = f"parsed {len(targets)} objects from goal conditions"
@@ -229,11 +308,13 @@ class TargetInference:
     def _try_task_map(
         self,
         task_name: str,
-        scene_objects: list,
+        scene_index: _SceneIndex,
         max_targets: int
     ) -> Dict[str, Any]:
         """
         Try to find targets using the manual TASK_TARGET_MAP.
+
+        scene_index wraps the scene's (obj, name_lower, category_lower) entries.
         """
         result = {'targets': [], 'source': 'task_map', 'details': ''}
 
@@ -246,18 +327,16 @@ class TargetInference:
         self.log(f"[TARGET] Looking for: {target_categories[:5]}...")
 
         targets = []
-        for target_cat in target_categories:
+        seen = set()  # id(obj) of collected targets; avoids list scans and wrapper __eq__
+        for cat_lower in TASK_TARGET_MAP_LOWER[task_name]:
             if len(targets) >= max_targets:
                 break
-            for obj in scene_objects:
-                if obj in targets:
-                    continue
-                obj_name = getattr(obj, 'name', '').lower()
-                obj_category = getattr(obj, 'category', '').lower()
-                if target_cat.lower() in obj_name or target_cat.lower() in obj_category:
-                    targets.append(obj)
-                    self.log(f"[TARGET] Found in scene: {obj.name} (category: {obj_category})")
-                    break
+            entry = scene_index.first_match(cat_lower, seen)
+            if entry is not None:
+                obj, _, obj_category = entry
+                targets.append(obj)
+                seen.add(id(obj))
+                self.log(f"[TARGET] Found in scene: {obj.name} (category: {obj_category})")
 
         if targets:
             result['targets'] = targets
@@ -270,46 +349,44 @@ class TargetInference:
     def _try_keyword_heuristic(
         self,
         instruction: str,
-        scene_objects: list,
+        scene_index: _SceneIndex,
         max_targets: int
     ) -> Dict[str, Any]:
         """
         Try to find targets using keyword heuristic from instruction.
+
+        scene_index wraps the scene's (obj, name_lower, category_lower) entries.
         """
         result = {'targets': [], 'source': 'keyword', 'details': ''}
 
         instruction_lower = instruction.lower().replace('_', ' ')
         targets = []
+        seen = set()
 
-        # Check each keyword mapping
-        for keyword, object_types in KEYWORD_MAPPINGS.items():
-            if keyword in instruction_lower:
-                for obj in scene_objects:
-                    if obj in targets or len(targets) >= max_targets:
-                        continue
-                    obj_name = getattr(obj, 'name', '').lower()
-                    obj_category = getattr(obj, 'category', '').lower()
-                    for obj_type in object_types:
-                        if obj_type in obj_name or obj_type in obj_category:
-                            targets.append(obj)
-                            self.log(f"[TARGET] Found via keyword '{keyword}': {obj.name}")
-                            break
+        # Resolve matching keywords in one pass, then scan the scene only for those
+        matched = [(kw, types) for kw, types in KEYWORD_MAPPINGS_LOWER if kw in instruction_lower]
+        for keyword, object_types in matched:
+            if len(targets) >= max_targets:
+                break
+            for obj, _, _ in scene_index.matches_any(object_types, seen):
+                if len(targets) >= max_targets:
+                    break
+                targets.append(obj)
+                seen.add(id(obj))
+                self.log(f"[TARGET] Found via keyword '{keyword}': {obj.name}")
 
         # Also try direct word matching
         if len(targets) < max_targets:
-            words = instruction_lower.split()
+            words = [w for w in instruction_lower.split() if len(w) >= 3]
             for word in words:
-                if len(word) < 3 or len(targets) >= max_targets:
-                    continue
-                for obj in scene_objects:
-                    if obj in targets:
-                        continue
-                    obj_name = getattr(obj, 'name', '').lower()
-                    obj_category = getattr(obj, 'category', '').lower()
-                    if word in obj_name or word in obj_category:
-                        targets.append(obj)
-                        self.log(f"[TARGET] Found via direct match '{word}': {obj.name}")
-                        break
+                if len(targets) >= max_targets:
+                    break
+                entry = scene_index.first_match(word, seen)
+                if entry is not None:
+                    obj = entry[0]
+                    targets.append(obj)
+                    seen.add(id(obj))
+                    self.log(f"[TARGET] Found via direct match '{word}': {obj.name}")
 
         if targets:
             result['targets'] = targets
@@ -323,21 +400,22 @@ class TargetInference:
     def _find_objects_by_names(
         self,
         names: List[str],
-        scene_objects: list,
+        scene_entries: list,
         max_targets: int
     ) -> list:
-        """Find scene objects matching a list of names."""
+        """Find scene objects matching a list of names (entries: (obj, name_lower, category_lower))."""
         targets = []
+        seen = set()
         for name in names:
             if len(targets) >= max_targets:
                 break
             name_lower = name.lower()
-            for obj in scene_objects:
-                if obj in targets:
+            for obj, obj_name, _ in scene_entries:
+                if id(obj) in seen:
                     continue
-                obj_name = getattr(obj, 'name', '').lower()
                 if name_lower in obj_name or obj_name in name_lower:
                     targets.append(obj)
+                    seen.add(id(obj))
                     break
         return targets
 
@@ -5,16 +5,40 @@ Records episode execution to video file with tick-throttled capture.
 Single capture clock to avoid duplicates and timing drift.
 """
 
+import functools
 import os
 import time
 import tempfile
+import traceback
 import subprocess
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List, Optional, Callable, Dict, Any
+from typing import Optional, Callable, Dict, Any
 import numpy as np
 from PIL import Image
 
+try:
+    import cv2
+except ImportError:
+    cv2 = None
+
+
+@functools.lru_cache(maxsize=1)
+def _imageio_available() -> bool:
+    """Check (once per process) if imageio is available for video encoding."""
+    try:
+        import imageio
+        return True
+    except ImportError:
+        return False
+
+
+@functools.lru_cache(maxsize=1)
+def _ffmpeg_available() -> bool:
+    """Check (once per process) if ffmpeg is available in PATH."""
+    return shutil.which("ffmpeg") is not None
+
 
 class VideoRecorder:
     """
@@ -31,6 +55,9 @@ class VideoRecorder:
     """
 
     SUPPORTED_VIEWS = ["head", "composite", "birds_eye", "follow_cam", "front_view"]
+    COMPOSITE_CELL_SIZE = 512
+    INITIAL_FRAME_CAPACITY = 64  # Buffered frames before the first grow
+    MAX_CAPTURE_FAILURES = 10  # Consecutive failures before capture is disabled
 
     def __init__(
         self,
@@ -63,32 +90,72 @@ class VideoRecorder:
         # Capture clock: throttle to ~fps frames per second of sim time
         # Assuming ~60 sim ticks/sec, capture every (60/fps) ticks
         self.tick_interval = max(1, 60 // fps)
-        self.tick_counter = 0
-
-        # Recording state
-        self.frames: List[np.ndarray] = []
+        # Countdown to the next capture (cheaper per tick than a modulo);
+        # tick_counter is derived from it and _due_count
+        self._ticks_until_capture = self.tick_interval
+        self._due_count = 0
+
+        # Recording state. With imageio, frames are streamed to self._writer
+        # as they are captured; otherwise they are copied into one contiguous
+        # (N, H, W, 3) buffer that grows geometrically (see self.frames).
+        self._frame_buf: Optional[np.ndarray] = None
+        self._n_frames = 0
+        self.frame_count = 0
+        self._capture_fail_count = 0
+        self._capture_disabled = False
+        self._writer = None
+        self._writer_path: Optional[Path] = None
+        # (H, W) of the streamed video and frames appended to it so far
+        self._writer_size: Optional[tuple] = None
+        self._writer_frames = 0
+        # (path, n_frames) of a stream that was closed early after a writer error
+        self._partial_video: Optional[tuple] = None
+
+        # Composite grid, recomputed only when the set of views changes
+        self._composite_layout: Optional[tuple] = None
+        self._composite_buf: Optional[np.ndarray] = None
+        # Head camera key in robot obs, found on the first captured frame
+        self._head_sensor_key: Optional[str] = None
         self.recording = False
         self.episode_id = None
         self.start_time = None
 
         # Codec detection
-        self._imageio_available = self._check_imageio()
-        self._ffmpeg_available = self._check_ffmpeg()
+        self._imageio_available = _imageio_available()
+        self._ffmpeg_available = _ffmpeg_available()
 
         if not self._imageio_available and not self._ffmpeg_available:
             self.log("[VIDEO] WARNING: Neither imageio nor ffmpeg available. Video will save as frames only.")
 
-    def _check_imageio(self) -> bool:
-        """Check if imageio is available for video encoding."""
-        try:
-            import imageio
-            return True
-        except ImportError:
-            return False
+    @property
+    def frames(self) -> np.ndarray:
+        """Buffered frames as a contiguous (N, H, W, 3) uint8 view."""
+        if self._frame_buf is None:
+            return np.empty((0, 0, 0, 3), dtype=np.uint8)
+        return self._frame_buf[:self._n_frames]
+
+    def _buffer_frame(self, frame: np.ndarray):
+        """Copy a frame into the contiguous buffer, growing it by doubling."""
+        buf = self._frame_buf
+        if buf is None:
+            h, w = frame.shape[:2]
+            buf = self._frame_buf = np.empty((self.INITIAL_FRAME_CAPACITY, h, w, 3), dtype=np.uint8)
+        elif self._n_frames == len(buf):
+            grown = np.empty((2 * len(buf),) + buf.shape[1:], dtype=np.uint8)
+            grown[:self._n_frames] = buf
+            buf = self._frame_buf = grown
+
+        h, w = buf.shape[1:3]
+        if frame.shape[:2] != (h, w):
+            # e.g. composite grid changed when a sensor appeared mid-episode
+            frame = self._resize_frame(frame, w, h)
+        buf[self._n_frames] = frame
+        self._n_frames += 1
 
-    def _check_ffmpeg(self) -> bool:
-        """Check if ffmpeg is available in PATH."""
-        return shutil.which("ffmpeg") is not None
+    @property
+    def tick_counter(self) -> int:
+        """Ticks seen since recording started."""
+        return self._due_count * self.tick_interval + (self.tick_interval - self._ticks_until_capture)
 
     @property
     def env(self):
@@ -102,13 +169,117 @@ class VideoRecorder:
         Args:
             episode_id: Identifier for this episode
         """
-        self.frames = []
+        # A recording that was never stopped leaves its temp file behind
+        self._discard_writer()
+        self._discard_partial()
+        self._frame_buf = None
+        self._n_frames = 0
+        self.frame_count = 0
+        self._capture_fail_count = 0
+        self._capture_disabled = False
+        self._composite_layout = None
+        self._composite_buf = None
+        self._head_sensor_key = None
         self.recording = True
         self.episode_id = episode_id
-        self.tick_counter = 0
+        self._ticks_until_capture = self.tick_interval
+        self._due_count = 0
         self.start_time = time.time()
+        if self._imageio_available:
+            self._open_writer()
         self.log(f"[VIDEO] Recording started: view={self.view}, fps={self.fps}, tick_interval={self.tick_interval}")
 
+    def _open_writer(self):
+        """Open a streaming H.264 writer to a temp file in output_dir."""
+        try:
+            import imageio
+
+            self._writer_path = self.output_dir / f".{self.episode_id}_recording.mp4"
+            self._writer_size = None
+            self._writer_frames = 0
+            self._writer = imageio.get_writer(
+                str(self._writer_path),
+                fps=self.fps,
+                codec='libx264',
+                pixelformat='yuv420p',
+                quality=8
+            )
+        except Exception as e:
+            self.log(f"[VIDEO] Streaming writer unavailable, buffering frames: {e}")
+            self._writer = None
+            self._discard_writer()
+
+    def _close_writer(self) -> bool:
+        """Close the streaming writer, if any. Returns True if it closed cleanly."""
+        if self._writer is None:
+            return False
+        writer, self._writer = self._writer, None
+        try:
+            writer.close()
+            return True
+        except Exception as e:
+            self.log(f"[VIDEO] Closing streaming writer failed: {e}")
+            return False
+
+    def _discard_writer(self):
+        """Close the streaming writer (if any) and delete its temp file."""
+        self._close_writer()
+        writer_path, self._writer_path = self._writer_path, None
+        if writer_path is not None:
+            try:
+                writer_path.unlink()
+            except OSError:
+                pass
+
+    def _discard_partial(self):
+        """Delete the partial video of an earlier recording, if any."""
+        partial, self._partial_video = self._partial_video, None
+        if partial is not None:
+            try:
+                partial[0].unlink()
+            except OSError:
+                pass
+
+    def _stream_frame(self, frame: np.ndarray):
+        """
+        Append a frame to the streaming writer.
+
+        Frames are resized to the first streamed frame, as in _buffer_frame.
+        If the writer fails, the frames already encoded are kept as a partial
+        video and the rest of the episode is buffered.
+        """
+        if self._writer_size is None:
+            self._writer_size = frame.shape[:2]
+        elif frame.shape[:2] != self._writer_size:
+            h, w = self._writer_size
+            frame = self._resize_frame(frame, w, h)
+        try:
+            self._writer.append_data(frame)
+            self._writer_frames += 1
+        except Exception as e:
+            self.log(f"[VIDEO] ERROR: Streaming writer failed after {self._writer_frames} frames, "
+                     f"keeping them and buffering the rest of the episode: {e}")
+            self._end_stream()
+            self._buffer_frame(frame)
+
+    def _end_stream(self):
+        """
+        Close the streaming writer and keep its file as self._partial_video.
+
+        If the file cannot be finalized, it is deleted and its frames are
+        taken off frame_count so the stats match what is saved.
+        """
+        n_frames = self._writer_frames
+        self._writer_frames = 0
+        if self._close_writer() and n_frames:
+            self._partial_video = (self._writer_path, n_frames)
+            self._writer_path = None
+            return
+        if n_frames:
+            self.log(f"[VIDEO] ERROR: Streamed video could not be finalized, {n_frames} frames dropped")
+            self.frame_count -= n_frames
+        self._discard_writer()
+
     def should_capture_this_tick(self) -> bool:
         """
         Check if this tick should capture a frame.
@@ -118,16 +289,21 @@ class VideoRecorder:
         """
         if not self.recording:
             return False
-        self.tick_counter += 1
-        return (self.tick_counter % self.tick_interval) == 0
+        self._ticks_until_capture -= 1
+        if self._ticks_until_capture:
+            return False
+        self._ticks_until_capture = self.tick_interval
+        self._due_count += 1
+        return True
 
     def capture_frame_if_due(self):
         """
         Capture frame only if tick interval is met.
 
-        This is the main method called from bt_executor's tick loop.
+        This is the main method called from bt_executor's tick loop. Ticks
+        are still counted once capture is disabled.
         """
-        if self.should_capture_this_tick():
+        if self.should_capture_this_tick() and not self._capture_disabled:
             self._capture_frame()
 
     def _capture_frame(self):
@@ -142,16 +318,28 @@ class VideoRecorder:
                 frame = self._capture_composite_view(obs)
             else:
                 # External view (birds_eye, follow_cam, front_view)
-                frame = self._capture_external_view(self.view)
+                frame = self._capture_external_view(self.view, obs)
 
             if frame is not None:
-                self.frames.append(frame)
-                if len(self.frames) % 10 == 0:
-                    self.log(f"[VIDEO] Captured frame {len(self.frames)} (tick {self.tick_counter})")
-
-        except Exception as e:
-            # Don't let capture errors stop execution
-            pass
+                if self._writer is not None:
+                    self._stream_frame(frame)
+                else:
+                    self._buffer_frame(frame)
+                self.frame_count += 1
+                if self.frame_count % 10 == 0:
+                    self.log(f"[VIDEO] Captured frame {self.frame_count} (tick {self.tick_counter})")
+            self._capture_fail_count = 0
+
+        except Exception:
+            # Don't let capture errors stop execution; log the first one and
+            # stop trying once the failure looks persistent
+            self._capture_fail_count += 1
+            if self._capture_fail_count == 1:
+                self.log(f"[VIDEO] Frame capture failed (tick {self.tick_counter}):\n{traceback.format_exc()}")
+            if self._capture_fail_count >= self.MAX_CAPTURE_FAILURES:
+                self._capture_disabled = True
+                self.log(f"[VIDEO] {self._capture_fail_count} consecutive capture failures, "
+                         f"disabling capture for this episode")
 
     def _capture_head_view(self, obs) -> Optional[np.ndarray]:
         """Capture from robot head camera."""
@@ -160,13 +348,38 @@ class VideoRecorder:
 
         if robot_name and robot_name in obs:
             robot_obs = obs[robot_name]
+
+            # Fast path: sensor key found on an earlier frame
+            key = self._head_sensor_key
+            if key is not None:
+                sensor_data = robot_obs.get(key)
+                if isinstance(sensor_data, dict) and 'rgb' in sensor_data:
+                    return self._rgb_to_numpy(sensor_data['rgb'])
+                self._head_sensor_key = None
+
             for sensor_key, sensor_data in robot_obs.items():
                 if 'Camera' in sensor_key and isinstance(sensor_data, dict) and 'rgb' in sensor_data:
+                    self._head_sensor_key = sensor_key
                     return self._rgb_to_numpy(sensor_data['rgb'])
         return None
 
-    def _capture_external_view(self, view_name: str) -> Optional[np.ndarray]:
+    @staticmethod
+    def _external_obs(obs) -> Dict[str, Any]:
+        """
+        External sensor observations already gathered by env.get_obs().
+
+        OmniGibson's Environment.get_obs() reads every external sensor into
+        obs['external'], so reusing it avoids a second get_obs() per sensor.
+        """
+        external = obs.get('external') if isinstance(obs, dict) else None
+        return external if isinstance(external, dict) else {}
+
+    def _capture_external_view(self, view_name: str, obs=None) -> Optional[np.ndarray]:
         """Capture from external sensor (birds_eye, follow_cam, front_view)."""
+        sensor_obs = self._external_obs(obs).get(view_name)
+        if isinstance(sensor_obs, dict) and 'rgb' in sensor_obs:
+            return self._rgb_to_numpy(sensor_obs['rgb'])
+
         if hasattr(self.env, 'external_sensors') and self.env.external_sensors:
             sensor = self.env.external_sensors.get(view_name)
             if sensor:
@@ -187,9 +400,15 @@ class VideoRecorder:
         if head_frame is not None:
             views['head'] = head_frame
 
-        # External sensors
+        # External sensors: take what env.get_obs() already read, and only
+        # query sensors that are missing from it
+        external = self._external_obs(obs)
         if hasattr(self.env, 'external_sensors') and self.env.external_sensors:
             for name, sensor in self.env.external_sensors.items():
+                sensor_obs = external.get(name)
+                if isinstance(sensor_obs, dict) and 'rgb' in sensor_obs:
+                    views[name] = self._rgb_to_numpy(sensor_obs['rgb'])
+                    continue
                 try:
                     sensor_obs, _ = sensor.get_obs()
                     if sensor_obs and 'rgb' in sensor_obs:
@@ -204,14 +423,41 @@ class VideoRecorder:
 
     def _create_composite(self, views: Dict[str, np.ndarray]) -> np.ndarray:
         """Create 2x2 grid composite from multiple views."""
-        cell_size = 512
+        layout = self._composite_layout
+        if layout is None or layout[0] != tuple(views):
+            layout = self._composite_layout = self._build_composite_layout(views)
+        _, shape, slots, empty = layout
+
+        # Frames are encoded or copied into the frame buffer right away, so
+        # the canvas is reused; empty cells keep their background from the
+        # first fill
+        composite = self._composite_buf
+        if composite is None:
+            composite = self._composite_buf = np.empty(shape, dtype=np.uint8)
+            for ys, xs in empty:
+                composite[ys, xs] = 30  # Dark gray background
+
+        cell_size = self.COMPOSITE_CELL_SIZE
+        for name, ys, xs in slots:
+            composite[ys, xs] = self._resize_cell(views[name], cell_size)
+
+        return composite
+
+    def _build_composite_layout(self, views: Dict[str, np.ndarray]) -> tuple:
+        """
+        Compute the composite grid for a set of view names.
+
+        Returns:
+            (view_names, canvas_shape, [(name, y_slice, x_slice)], [(y_slice, x_slice)] of empty cells)
+        """
+        cell_size = self.COMPOSITE_CELL_SIZE
         view_order = ['birds_eye', 'front_view', 'follow_cam', 'head']
-        ordered = [(n, views[n]) for n in view_order if n in views]
+        ordered = [n for n in view_order if n in views]
 
         # Add any remaining views not in preferred order
-        for n, frame in views.items():
+        for n in views:
             if n not in view_order:
-                ordered.append((n, frame))
+                ordered.append(n)
 
         n_views = len(ordered)
         if n_views <= 2:
@@ -221,26 +467,38 @@ class VideoRecorder:
         else:
             cols, rows = 3, 2
 
-        composite = np.zeros((rows * cell_size, cols * cell_size, 3), dtype=np.uint8)
-        composite[:] = 30  # Dark gray background
-
-        for idx, (name, frame) in enumerate(ordered[:cols * rows]):
-            row = idx // cols
-            col = idx % cols
-
-            # Resize frame to cell size
-            img = Image.fromarray(frame)
-            img_resized = img.resize((cell_size, cell_size), Image.Resampling.LANCZOS)
-            frame_resized = np.array(img_resized)
-
-            y = row * cell_size
-            x = col * cell_size
-            composite[y:y + cell_size, x:x + cell_size] = frame_resized
-
-        return composite
+        cells = []
+        for idx in range(cols * rows):
+            y = (idx // cols) * cell_size
+            x = (idx % cols) * cell_size
+            cells.append((slice(y, y + cell_size), slice(x, x + cell_size)))
+
+        slots = [(name, ys, xs) for name, (ys, xs) in zip(ordered, cells)]
+        shape = (rows * cell_size, cols * cell_size, 3)
+        # New layout: drop the reusable canvas built for the previous one
+        self._composite_buf = None
+        return tuple(views), shape, slots, cells[n_views:]
+
+    @staticmethod
+    def _resize_cell(frame: np.ndarray, cell_size: int) -> np.ndarray:
+        """Resize a view to a square cell (cv2 INTER_AREA when available)."""
+        return VideoRecorder._resize_frame(frame, cell_size, cell_size)
+
+    @staticmethod
+    def _resize_frame(frame: np.ndarray, width: int, height: int) -> np.ndarray:
+        """Resize a frame to width x height (cv2 INTER_AREA when available)."""
+        if frame.shape[0] == height and frame.shape[1] == width:
+            return frame
+        if cv2 is not None:
+            return cv2.resize(np.ascontiguousarray(frame), (width, height),
+                              interpolation=cv2.INTER_AREA)
+        img = Image.fromarray(frame)
+        return np.asarray(img.resize((width, height), Image.Resampling.BILINEAR))
 
     def _rgb_to_numpy(self, rgb) -> np.ndarray:
         """Convert RGB data to numpy uint8 array."""
+        if getattr(getattr(rgb, 'device', None), 'type', None) == 'cuda':
+            rgb = self._shrink_on_device(rgb)
         if hasattr(rgb, 'cpu'):
             rgb_np = rgb.cpu().numpy()
         elif hasattr(rgb, 'numpy'):
@@ -248,14 +506,37 @@ class VideoRecorder:
         else:
             rgb_np = np.asarray(rgb)
 
-        if rgb_np.max() <= 1.0 and rgb_np.dtype != np.uint8:
-            rgb_np = (rgb_np * 255).astype(np.uint8)
-
         if len(rgb_np.shape) == 3 and rgb_np.shape[-1] == 4:
-            rgb_np = rgb_np[..., :3]
+            rgb_np = rgb_np[..., :3]  # view, no copy
+
+        # uint8 (the common case) needs no scan; floats are scaled in one pass
+        if rgb_np.dtype != np.uint8 and rgb_np.dtype.kind == 'f':
+            # A strided sample is enough to tell [0, 1] from [0, 255] data
+            scale = 255.0 if rgb_np.size and rgb_np.flat[::4096].max() <= 1.0 else 1.0
+            out = np.empty(rgb_np.shape, dtype=np.uint8)
+            np.multiply(rgb_np, scale, out=out, casting='unsafe')
+            rgb_np = out
 
         return rgb_np
 
+    @staticmethod
+    def _shrink_on_device(rgb):
+        """
+        Drop alpha and convert to uint8 while a CUDA tensor is still on the GPU.
+
+        The device-to-host copy then moves 3 uint8 channels instead of 4
+        (or 4 float32), cutting the per-frame transfer 1.3-5x.
+        """
+        if rgb.ndim == 3 and rgb.shape[-1] == 4:
+            rgb = rgb[..., :3]
+        if rgb.is_floating_point():
+            # Same sampled range check as the CPU path: a strided view (no
+            # copy) keeps the reduction, and the sync it forces, tiny
+            sample = rgb[::64, ::64] if rgb.ndim >= 2 else rgb
+            scale = 255.0 if sample.numel() and sample.max().item() <= 1.0 else 1.0
+            rgb = rgb.mul(scale).byte()
+        return rgb.contiguous()
+
     def stop_recording(self, success: bool = False) -> Optional[str]:
         """
         Stop recording and save video.
@@ -272,9 +553,13 @@ class VideoRecorder:
         self.recording = False
         duration = time.time() - self.start_time
 
-        self.log(f"[VIDEO] Recording stopped: {len(self.frames)} frames, {duration:.1f}s elapsed")
+        if self._writer is not None:
+            self._end_stream()
+        partial, self._partial_video = self._partial_video, None
+
+        self.log(f"[VIDEO] Recording stopped: {self.frame_count} frames, {duration:.1f}s elapsed")
 
-        if not self.frames:
+        if not self.frame_count:
             self.log("[VIDEO] No frames captured, skipping save")
             return None
 
@@ -284,6 +569,26 @@ class VideoRecorder:
         video_filename = f"{self.episode_id}_{ts}_{self.view}_{result_suffix}.mp4"
         video_path = self.output_dir / video_filename
 
+        # Frames were already encoded while recording
+        if partial is not None:
+            partial_path, n_streamed = partial
+            if self._n_frames:
+                # The writer failed mid-episode: the streamed frames are part 1,
+                # the buffered rest is saved below as part 2
+                streamed_path = video_path.with_name(f"{video_path.stem}_part1{video_path.suffix}")
+                video_path = video_path.with_name(f"{video_path.stem}_part2{video_path.suffix}")
+            else:
+                streamed_path = video_path
+            try:
+                partial_path.replace(streamed_path)
+                self._log_video_stats(streamed_path, codec="libx264", n_frames=n_streamed)
+            except OSError as e:
+                self.log(f"[VIDEO] ERROR: Streamed video could not be moved to {streamed_path}, "
+                         f"left at {partial_path}: {e}")
+                streamed_path = partial_path
+            if not self._n_frames:
+                return str(streamed_path)
+
         # Try primary codec (imageio + H.264)
         if self._imageio_available:
             saved_path = self._save_with_imageio(video_path)
@@ -300,24 +605,60 @@ class VideoRecorder:
         return self._save_frames_only(video_path)
 
     def _save_with_imageio(self, video_path: Path) -> Optional[str]:
-        """Save video using imageio with H.264 codec."""
-        try:
-            import imageio
-
-            self.log(f"[VIDEO] Encoding with H.264 (imageio)...")
-
-            writer = imageio.get_writer(
-                str(video_path),
-                fps=self.fps,
-                codec='libx264',
-                pixelformat='yuv420p',
-                quality=8
-            )
-
-            for frame in self.frames:
-                writer.append_data(frame)
+        """
+        Save video with H.264 by piping raw RGB frames into imageio's ffmpeg.
 
-            writer.close()
+        One ffmpeg session reads rgb24 from stdin, so there is no per-frame
+        imageio dispatch. Falls back to ffmpeg in PATH if imageio-ffmpeg is
+        missing.
+        """
+        try:
+            try:
+                import imageio_ffmpeg
+                ffmpeg_exe = imageio_ffmpeg.get_ffmpeg_exe()
+            except ImportError:
+                ffmpeg_exe = shutil.which("ffmpeg")
+            if ffmpeg_exe is None:
+                return None
+
+            self.log(f"[VIDEO] Encoding with H.264 (imageio ffmpeg, raw pipe)...")
+
+            h, w = self.frames[0].shape[:2]
+            cmd = [
+                ffmpeg_exe, "-y",
+                "-f", "rawvideo",
+                "-pix_fmt", "rgb24",
+                "-s", f"{w}x{h}",
+                "-r", str(self.fps),
+                "-i", "-",
+                # yuv420p needs even dimensions
+                "-vf", "pad=ceil(iw/2)*2:ceil(ih/2)*2",
+                "-c:v", "libx264",
+                "-pix_fmt", "yuv420p",
+                "-crf", "18",
+                str(video_path)
+            ]
+
+            # stderr goes to a file so a chatty ffmpeg cannot block the pipe
+            with tempfile.TemporaryFile() as err:
+                proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stderr=err)
+                try:
+                    # The frame buffer is contiguous: one write for the episode
+                    proc.stdin.write(self.frames)
+                except BrokenPipeError:
+                    pass  # ffmpeg exited early; its stderr says why
+                finally:
+                    try:
+                        proc.stdin.close()
+                    except BrokenPipeError:
+                        pass
+                    returncode = proc.wait()
+                err.seek(0)
+                stderr = err.read().decode(errors='replace')
+
+            if returncode != 0:
+                self.log(f"[VIDEO] imageio ffmpeg failed (exit code {returncode}): {stderr[-200:]}")
+                return None
 
             self._log_video_stats(video_path, codec="libx264")
             return str(video_path)
@@ -333,10 +674,8 @@ class VideoRecorder:
             with tempfile.TemporaryDirectory() as tmpdir:
                 self.log(f"[VIDEO] Saving frames to temp directory for ffmpeg...")
 
-                # Save frames as PNG
-                for i, frame in enumerate(self.frames):
-                    frame_path = Path(tmpdir) / f"frame_{i:06d}.png"
-                    Image.fromarray(frame).save(frame_path)
+                # Save frames as PNG (temp files: favour speed over size)
+                self._write_png_frames(Path(tmpdir), compress_level=1)
 
                 # Encode with ffmpeg
                 frame_pattern = str(Path(tmpdir) / "frame_%06d.png")
@@ -371,29 +710,49 @@ class VideoRecorder:
 
         self.log(f"[VIDEO] Saving individual frames to: {frames_dir}")
 
-        for i, frame in enumerate(self.frames):
-            frame_path = frames_dir / f"frame_{i:06d}.png"
-            Image.fromarray(frame).save(frame_path)
+        self._write_png_frames(frames_dir)
 
         self.log(f"[VIDEO] Saved {len(self.frames)} frames")
         self.log(f"[VIDEO] To create video manually: ffmpeg -framerate {self.fps} -i {frames_dir}/frame_%06d.png -c:v libx264 -pix_fmt yuv420p output.mp4")
 
         return str(frames_dir)
 
-    def _log_video_stats(self, video_path: Path, codec: str = "unknown"):
-        """Log video statistics."""
+    def _write_png_frames(self, frames_dir: Path, compress_level: int = 6):
+        """
+        Write buffered frames as frame_%06d.png in parallel.
+
+        PIL releases the GIL while zlib compresses, so a thread pool scales
+        with cores.
+
+        Args:
+            frames_dir: Destination directory (must exist)
+            compress_level: PNG zlib level (0-9)
+        """
+        def save(i):
+            Image.fromarray(self.frames[i]).save(
+                frames_dir / f"frame_{i:06d}.png", compress_level=compress_level
+            )
+
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            # list() re-raises the first save error, if any
+            list(pool.map(save, range(len(self.frames))))
+
+    def _log_video_stats(self, video_path: Path, codec: str = "unknown", n_frames: Optional[int] = None):
+        """Log video statistics (n_frames defaults to the buffered frames)."""
+        if n_frames is None:
+            n_frames = self._n_frames
         file_size_mb = video_path.stat().st_size / (1024 * 1024)
-        duration_sec = len(self.frames) / self.fps
+        duration_sec = n_frames / self.fps
 
         self.log(f"[VIDEO] Saved: {video_path}")
-        self.log(f"[VIDEO] Stats: {len(self.frames)} frames, {duration_sec:.1f}s @ {self.fps}fps, {file_size_mb:.1f}MB, codec={codec}")
+        self.log(f"[VIDEO] Stats: {n_frames} frames, {duration_sec:.1f}s @ {self.fps}fps, {file_size_mb:.1f}MB, codec={codec}")
 
     def get_stats(self) -> Dict[str, Any]:
         """Get current recording statistics."""
         return {
             'recording': self.recording,
             'episode_id': self.episode_id,
-            'frames': len(self.frames),
+            'frames': self.frame_count,
             'ticks': self.tick_counter,
             'view': self.view,
             'fps': self.fps,
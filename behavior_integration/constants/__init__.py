@@ -1,6 +1,10 @@
 """Constants module for behavior integration."""
 
-from .task_mappings import TASK_OBJECT_MAPPINGS, GENERAL_KEYWORD_MAPPINGS
+from .task_mappings import (
+    TASK_OBJECT_MAPPINGS,
+    GENERAL_KEYWORD_MAPPINGS,
+    match_keywords,
+)
 from .primitive_config import (
     PrimitiveConfig,
     DEFAULT_PRIMITIVE_CONFIG,
@@ -14,6 +18,7 @@ __all__ = [
     # Task object mappings
     'TASK_OBJECT_MAPPINGS',
     'GENERAL_KEYWORD_MAPPINGS',
+    'match_keywords',
     # Primitive configuration
     'PrimitiveConfig',
     'DEFAULT_PRIMITIVE_CONFIG',
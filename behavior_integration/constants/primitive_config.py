@@ -16,11 +16,11 @@ Usage:
     settle_steps = config.place_settle_steps
 """
 
-from dataclasses import dataclass, fields
+from dataclasses import dataclass, fields, replace
 from typing import Dict, List, Optional, Tuple
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class PrimitiveConfig:
     """
     Configuration for primitive execution parameters.
@@ -28,6 +28,10 @@ class PrimitiveConfig:
     All fields are Optional - None means "use default".
     This allows partial overrides (e.g., only override settle_steps).
 
+    Instances compare and hash by identity (eq=False): get_primitive_config
+    returns shared instances, and several fields hold lists/dicts that would
+    make a field-wise hash fail anyway.
+
     Attributes:
         instant_settle_steps: Settling steps for instant primitives (TOGGLE_ON/OFF, RELEASE, OPEN, CLOSE)
         place_settle_steps: Settling steps for placement primitives (PLACE_NEXT_TO, PLACE_INSIDE)
@@ -247,6 +251,20 @@ DEFAULT_PRIMITIVE_CONFIG = PrimitiveConfig(
     freeze_containers=None,                # Don't freeze any containers by default
 )
 
+# Field names and default values, computed once instead of calling fields() per lookup
+_FIELD_NAMES: Tuple[str, ...] = tuple(f.name for f in fields(PrimitiveConfig))
+_DEFAULT_DICT: Dict[str, object] = {name: getattr(DEFAULT_PRIMITIVE_CONFIG, name) for name in _FIELD_NAMES}
+
+
+def _build_delta(config: PrimitiveConfig) -> Dict[str, object]:
+    """Return only the fields an override actually sets (non-None), as a plain dict."""
+    delta = {}
+    for name in _FIELD_NAMES:
+        value = getattr(config, name)
+        if value is not None:
+            delta[name] = value
+    return delta
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # CATEGORY-LEVEL OVERRIDES
@@ -275,6 +293,11 @@ CATEGORY_PRIMITIVE_OVERRIDES: Dict[str, PrimitiveConfig] = {
     ),
 }
 
+# Non-None fields of each category override, merged with a single dict.update
+_CATEGORY_DELTAS: Dict[str, Dict[str, object]] = {
+    category: _build_delta(config) for category, config in CATEGORY_PRIMITIVE_OVERRIDES.items()
+}
+
 
 # ═══════════════════════════════════════════════════════════════════════════════
 # TASK-SPECIFIC OVERRIDES (highest priority)
@@ -291,7 +314,7 @@ def _load_task_overrides() -> Dict[str, PrimitiveConfig]:
         return {}
 
 
-# Lazy-loaded on first access
+# Loaded at import (see bottom of module)
 _TASK_OVERRIDES_CACHE = None
 
 
@@ -303,10 +326,73 @@ def get_task_overrides() -> Dict[str, PrimitiveConfig]:
     return _TASK_OVERRIDES_CACHE
 
 
+_TASK_DELTAS_CACHE = None
+
+
+def _get_task_deltas() -> Dict[str, Dict[str, object]]:
+    """Get non-None fields of each task override (built once, after overrides load)."""
+    global _TASK_DELTAS_CACHE
+    if _TASK_DELTAS_CACHE is None:
+        _TASK_DELTAS_CACHE = {
+            task_id: _build_delta(config) for task_id, config in get_task_overrides().items()
+        }
+    return _TASK_DELTAS_CACHE
+
+
 # For backwards compatibility - will be populated on first access to get_primitive_config
 TASK_PRIMITIVE_OVERRIDES: Dict[str, PrimitiveConfig] = {}
 
 
+# Fully merged configs keyed by (task_id, category). Every known pair is built
+# at import; other pairs are added lazily.
+_MERGED: Dict[Tuple[Optional[str], Optional[str]], PrimitiveConfig] = {}
+
+# Per-field source labels for get_config_summary, keyed like _MERGED
+_SOURCE_MAP: Dict[Tuple[Optional[str], Optional[str]], Dict[str, str]] = {}
+
+
+def _merge_config(task_id: Optional[str], category: Optional[str]) -> PrimitiveConfig:
+    """Merge defaults, category and task overrides into a new PrimitiveConfig."""
+    # Collect only the overridden fields; defaults come from replace()
+    delta = {}
+
+    # Layer 2: Apply category overrides (lower priority)
+    if category and category in _CATEGORY_DELTAS:
+        delta.update(_CATEGORY_DELTAS[category])
+
+    # Layer 3: Apply task-specific overrides (highest priority)
+    # Loaded from task_overrides/ directory
+    task_deltas = _get_task_deltas()
+    if task_id and task_id in task_deltas:
+        delta.update(task_deltas[task_id])
+
+    if not delta:
+        # Nothing to merge: share the frozen default instance
+        return DEFAULT_PRIMITIVE_CONFIG
+    return replace(DEFAULT_PRIMITIVE_CONFIG, **delta)
+
+
+def _build_source_map(task_id: Optional[str], category: Optional[str]) -> Dict[str, str]:
+    """Label each field with the layer it comes from: task, category or default."""
+    sources = dict.fromkeys(_FIELD_NAMES, "default")
+    if category and category in _CATEGORY_DELTAS:
+        sources.update(dict.fromkeys(_CATEGORY_DELTAS[category], f"category:{category}"))
+    task_deltas = _get_task_deltas()
+    if task_id and task_id in task_deltas:
+        sources.update(dict.fromkeys(task_deltas[task_id], f"task:{task_id}"))
+    return sources
+
+
+def _materialize_merged():
+    """Build the merged config and source map for every known (task_id, category) pair."""
+    task_ids = list(_get_task_deltas()) + [None]
+    categories = list(_CATEGORY_DELTAS) + [None]
+    for task_id in task_ids:
+        for category in categories:
+            _MERGED[(task_id, category)] = _merge_config(task_id, category)
+            _SOURCE_MAP[(task_id, category)] = _build_source_map(task_id, category)
+
+
 def get_primitive_config(
     task_id: Optional[str] = None,
     category: Optional[str] = None
@@ -314,6 +400,11 @@ def get_primitive_config(
     """
     Get merged primitive configuration for a task.
 
+    Configs for all known (task_id, category) pairs are pre-merged at
+    import, so lookups are a single dict get returning a shared frozen
+    instance. Callers must not mutate list/dict field values of the
+    returned config.
+
     Resolution order (highest to lowest priority):
     1. Task-specific overrides (TASK_PRIMITIVE_OVERRIDES)
     2. Category-specific overrides (CATEGORY_PRIMITIVE_OVERRIDES)
@@ -330,30 +421,11 @@ def get_primitive_config(
         >>> config = get_primitive_config("07_picking_up_toys", "placement_container")
         >>> config.sampling_attempts  # Returns task-specific or category or default
     """
-    # Start with default values
-    result = {}
-    for field in fields(DEFAULT_PRIMITIVE_CONFIG):
-        result[field.name] = getattr(DEFAULT_PRIMITIVE_CONFIG, field.name)
-
-    # Layer 2: Apply category overrides (lower priority)
-    if category and category in CATEGORY_PRIMITIVE_OVERRIDES:
-        cat_config = CATEGORY_PRIMITIVE_OVERRIDES[category]
-        for field in fields(cat_config):
-            value = getattr(cat_config, field.name)
-            if value is not None:
-                result[field.name] = value
-
-    # Layer 3: Apply task-specific overrides (highest priority)
-    # Loaded from task_overrides/ directory
-    task_overrides = get_task_overrides()
-    if task_id and task_id in task_overrides:
-        task_config = task_overrides[task_id]
-        for field in fields(task_config):
-            value = getattr(task_config, field.name)
-            if value is not None:
-                result[field.name] = value
-
-    return PrimitiveConfig(**result)
+    key = (task_id, category)
+    config = _MERGED.get(key)
+    if config is None:
+        config = _MERGED[key] = _merge_config(task_id, category)
+    return config
 
 
 def get_config_summary(task_id: Optional[str] = None, category: Optional[str] = None) -> str:
@@ -372,22 +444,19 @@ def get_config_summary(task_id: Optional[str] = None, category: Optional[str] =
     config = get_primitive_config(task_id, category)
     lines = [f"PrimitiveConfig for task='{task_id}', category='{category}':"]
 
-    for field in fields(config):
-        value = getattr(config, field.name)
-        default_value = getattr(DEFAULT_PRIMITIVE_CONFIG, field.name)
-
-        # Determine source
-        source = "default"
-        task_overrides = get_task_overrides()
-        if task_id and task_id in task_overrides:
-            task_value = getattr(task_overrides[task_id], field.name)
-            if task_value is not None:
-                source = f"task:{task_id}"
-        if source == "default" and category and category in CATEGORY_PRIMITIVE_OVERRIDES:
-            cat_value = getattr(CATEGORY_PRIMITIVE_OVERRIDES[category], field.name)
-            if cat_value is not None:
-                source = f"category:{category}"
+    key = (task_id, category)
+    sources = _SOURCE_MAP.get(key)
+    if sources is None:
+        sources = _SOURCE_MAP[key] = _build_source_map(task_id, category)
 
-        lines.append(f"  {field.name}: {value} ({source})")
+    for name in _FIELD_NAMES:
+        lines.append(f"  {name}: {getattr(config, name)} ({sources[name]})")
 
     return "\n".join(lines)
+
+
+# Load task overrides and pre-merge all configs at import, so lookups need no
+# lazy-init checks. The override modules only import PrimitiveConfig, which is
+# already defined above, so the circular import is safe here.
+_TASK_OVERRIDES_CACHE = _load_task_overrides()
+_materialize_merged()
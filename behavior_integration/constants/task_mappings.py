@@ -9,6 +9,18 @@ Key principles:
 2. If objects are accessible -> manipulable object FIRST
 """
 
+import sys
+from types import MappingProxyType
+
+
+def _freeze(mapping):
+    """Read-only copy of a name -> [names] table with interned keys and tuple values."""
+    return MappingProxyType({
+        sys.intern(key): tuple(sys.intern(name) for name in names)
+        for key, names in mapping.items()
+    })
+
+
 # Per-task object mappings (highest priority when task_id is known)
 # Format: task_id -> [object1, object2, ...] where first = primary focus
 TASK_OBJECT_MAPPINGS = {
@@ -313,6 +325,7 @@ TASK_OBJECT_MAPPINGS = {
     # ═══════════════════════════════════════════════════════════════
     '49_make_pizza': ['electric_refrigerator', 'tupperware', 'grated_cheese', 'pepperoni', 'mushroom', 'vidalia_onion', 'pizza_dough', 'cookie_sheet', 'carving_knife', 'oven'],
 }
+TASK_OBJECT_MAPPINGS = _freeze(TASK_OBJECT_MAPPINGS)
 
 
 # General fallback keyword mappings (used when task_id is NOT provided)
@@ -357,3 +370,24 @@ GENERAL_KEYWORD_MAPPINGS = {
     # Cleaning
     'clean': ['sponge', 'scrub_brush', 'broom', 'washer'],
 }
+GENERAL_KEYWORD_MAPPINGS = _freeze(GENERAL_KEYWORD_MAPPINGS)
+
+# (keyword, object_types) pairs in table order, for match_keywords
+_KEYWORD_ITEMS = tuple(GENERAL_KEYWORD_MAPPINGS.items())
+
+
+def match_keywords(text: str):
+    """
+    Return (keyword, object_types) for every GENERAL_KEYWORD_MAPPINGS keyword
+    contained in text, in table order.
+
+    Keywords may overlap (e.g. 'fridge' inside 'refrigerator'), so each one is
+    tested with a C-level substring check rather than a single regex pass.
+
+    Args:
+        text: Lowercased instruction text
+
+    Returns:
+        List of (keyword, object_types) tuples
+    """
+    return [item for item in _KEYWORD_ITEMS if item[0] in text]
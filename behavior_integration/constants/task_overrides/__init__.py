@@ -20,19 +20,75 @@ Adding a new override:
     3. The loader will auto-discover it on next import
 """
 
+import hashlib
 import importlib
-import pkgutil
+import os
+import pickle
 from pathlib import Path
-from typing import Dict, TYPE_CHECKING
+from types import MappingProxyType
+from typing import Dict, List, Mapping, TYPE_CHECKING
 
 if TYPE_CHECKING:
     from behavior_integration.constants.primitive_config import PrimitiveConfig
 
 
+# Pickled {task_id: OVERRIDE} from the last full load, prefixed with the
+# 8-byte fingerprint of the sources it was built from (see load_all_overrides)
+_CACHE_PATH = Path(__file__).with_name('_cache.pkl')
+
+
+def _override_paths(package_dir: Path) -> List[Path]:
+    """List the override files (public *.py modules) in package_dir, sorted by name."""
+    return sorted(p for p in package_dir.glob('*.py') if not p.name.startswith('_'))
+
+
+def _sources_fingerprint(package_dir: Path, override_paths: List[Path]) -> bytes:
+    """
+    Hash (name, mtime, size) of every override file and of primitive_config.py.
+
+    primitive_config.py is included because the pickled overrides are only
+    valid for the PrimitiveConfig layout they were created with.
+    """
+    paths = override_paths + [package_dir.parent / 'primitive_config.py']
+    digest = hashlib.blake2b(digest_size=8)
+    for path in paths:
+        st = path.stat()
+        digest.update(f"{path.name}:{st.st_mtime_ns}:{st.st_size}\n".encode())
+    return digest.digest()
+
+
+def _read_cache(fingerprint: bytes):
+    """Return the cached overrides if the cache matches fingerprint, else None."""
+    try:
+        data = _CACHE_PATH.read_bytes()
+        if data[:len(fingerprint)] != fingerprint:
+            return None
+        return pickle.loads(data[len(fingerprint):])
+    except Exception:
+        return None
+
+
+def _write_cache(fingerprint: bytes, overrides: Dict[str, 'PrimitiveConfig']):
+    """Write the cache atomically; silently skipped on read-only installs."""
+    tmp_path = _CACHE_PATH.with_name(f'{_CACHE_PATH.name}.{os.getpid()}.tmp')
+    try:
+        tmp_path.write_bytes(fingerprint + pickle.dumps(overrides, protocol=pickle.HIGHEST_PROTOCOL))
+        os.replace(tmp_path, _CACHE_PATH)
+    except Exception:
+        try:
+            tmp_path.unlink()
+        except OSError:
+            pass
+
+
 def load_all_overrides() -> Dict[str, 'PrimitiveConfig']:
     """
     Dynamically load all task override modules from this directory.
 
+    The result is cached in _cache.pkl, keyed by a fingerprint of the source
+    files, so unchanged overrides are unpickled instead of importing every
+    module.
+
     Returns:
         Dict mapping task_id to PrimitiveConfig override
 
@@ -44,13 +100,21 @@ def load_all_overrides() -> Dict[str, 'PrimitiveConfig']:
     overrides = {}
     package_dir = Path(__file__).parent
 
-    # Iterate through all .py files in this directory
-    for module_info in pkgutil.iter_modules([str(package_dir)]):
-        module_name = module_info.name
-
-        # Skip private modules (starting with _)
-        if module_name.startswith('_'):
-            continue
+    # A single directory listing serves both the cache check and the imports
+    override_paths = _override_paths(package_dir)
+    try:
+        fingerprint = _sources_fingerprint(package_dir, override_paths)
+    except OSError:
+        fingerprint = None
+    if fingerprint is not None:
+        cached = _read_cache(fingerprint)
+        if cached is not None:
+            return cached
+
+    failed = False
+    # Iterate through all public .py files in this directory
+    for path in override_paths:
+        module_name = path.stem
 
         try:
             # Import the module
@@ -65,14 +129,19 @@ def load_all_overrides() -> Dict[str, 'PrimitiveConfig']:
                 # print(f"  [OVERRIDE] Loaded: {task_id}")
 
         except Exception as e:
+            failed = True
             print(f"  [OVERRIDE] Warning: Failed to load {module_name}: {e}")
 
+    # Don't cache a partial load; a failing module may be fixed without its mtime changing
+    if fingerprint is not None and not failed:
+        _write_cache(fingerprint, overrides)
+
     return overrides
 
 
 def get_override_for_task(task_id: str) -> 'PrimitiveConfig':
     """
-    Get override for a specific task (loads on demand).
+    Get override for a specific task (from the loaded registry).
 
     Args:
         task_id: Task identifier (e.g., "07_picking_up_toys")
@@ -80,27 +149,16 @@ def get_override_for_task(task_id: str) -> 'PrimitiveConfig':
     Returns:
         PrimitiveConfig if override exists, None otherwise
     """
-    try:
-        module = importlib.import_module(
-            f"behavior_integration.constants.task_overrides.{task_id}"
-        )
-        if hasattr(module, 'OVERRIDE'):
-            return module.OVERRIDE
-    except ImportError:
-        pass  # No override for this task
-    except Exception as e:
-        print(f"  [OVERRIDE] Error loading {task_id}: {e}")
-
-    return None
+    return get_loaded_overrides().get(task_id)
 
 
-# Pre-load all overrides at import time for use in TASK_PRIMITIVE_OVERRIDES
+# Read-only registry of all overrides, filled on first access
 _LOADED_OVERRIDES = None
 
 
-def get_loaded_overrides() -> Dict[str, 'PrimitiveConfig']:
-    """Get cached overrides (loads once on first call)."""
+def get_loaded_overrides() -> Mapping[str, 'PrimitiveConfig']:
+    """Get the frozen task_id -> override registry (loads once on first call)."""
     global _LOADED_OVERRIDES
     if _LOADED_OVERRIDES is None:
-        _LOADED_OVERRIDES = load_all_overrides()
+        _LOADED_OVERRIDES = MappingProxyType(load_all_overrides())
     return _LOADED_OVERRIDES
@@ -22,12 +22,6 @@ _og_path = os.getenv("OMNIGIBSON_PATH", f"{_b1k_dir}/OmniGibson")
 if os.path.exists(_og_path):
     sys.path.insert(0, _og_path)
 
-from embodied_bt_brain.runtime import (
-    BehaviorTreeExecutor,
-    PALPrimitiveBridge,
-    ValidatorLogger
-)
-
 
 def main():
     parser = argparse.ArgumentParser()
@@ -36,9 +30,14 @@ def main():
     parser.add_argument("--scene", default="Rs_int", help="Scene model")
     parser.add_argument("--robot", default="Fetch", help="Robot type")
     parser.add_argument("--max-ticks", type=int, default=1000, help="Max BT ticks")
+    parser.add_argument("--variant", type=int, default=-1,
+                        help="Index of the BT variant to execute when --bt-file is a pattern (default: last)")
 
     args = parser.parse_args()
 
+    # Deferred so --help and bad arguments don't pay for the BT runtime import
+    from embodied_bt_brain.runtime import BehaviorTreeExecutor, PALPrimitiveBridge
+
     print("="*80)
     print("BT Execution in BEHAVIOR-1K (behavior environment)")
     print("="*80)
@@ -67,13 +66,17 @@ def main():
         bt_files = [str(bt_path)]
         print(f"✓ Found 1 BT file")
 
-    # Load all variants
-    bt_variants = []
     for bt_file in bt_files:
-        with open(bt_file) as f:
-            bt_xml = f.read()
-        bt_variants.append((bt_file, bt_xml))
-        print(f"  - {bt_file} ({len(bt_xml)} chars)")
+        print(f"  - {bt_file} ({os.path.getsize(bt_file)} bytes)")
+
+    # Only the selected variant is read and parsed
+    try:
+        bt_file = bt_files[args.variant]
+    except IndexError:
+        print(f"✗ Variant index {args.variant} out of range ({len(bt_files)} file(s))")
+        sys.exit(1)
+    bt_xml = Path(bt_file).read_text()
+    print(f"✓ Using variant: {bt_file}")
 
     # Parse BT
     print("\n[2/4] Parsing BT...")
@@ -164,20 +167,29 @@ def main():
     tick_count = 0
     success = False
 
+    # Hoisted out of the tick loop
+    tick = bt_root.tick
+    SUCCESS = NodeStatus.SUCCESS
+    FAILURE = NodeStatus.FAILURE
+    PRINT_EVERY = 10
+    ticks_until_print = PRINT_EVERY
+
     try:
         while tick_count < args.max_ticks:
-            status = bt_root.tick(context)
+            status = tick(context)
             tick_count += 1
 
-            if tick_count % 10 == 0:
+            ticks_until_print -= 1
+            if not ticks_until_print:
                 print(f"  Tick {tick_count}: {status.value}")
+                ticks_until_print = PRINT_EVERY
 
-            if status == NodeStatus.SUCCESS:
+            if status is SUCCESS:
                 print(f"\n✓ BT succeeded after {tick_count} ticks")
                 success = True
                 break
 
-            if status == NodeStatus.FAILURE:
+            if status is FAILURE:
                 print(f"\n✗ BT failed after {tick_count} ticks")
                 break
 
@@ -45,7 +45,12 @@ def main():
     # Load image
     if args.image:
         print(f"Loading image: {args.image}")
-        image = Image.open(args.image).convert("RGB")
+        image = Image.open(args.image)
+        if args.model == "gemma3-4b":
+            # Gemma 3 resizes every image to 896x896; let libjpeg decode large
+            # JPEGs at a reduced DCT scale (never below that size)
+            image.draft("RGB", (896, 896))
+        image = image.convert("RGB")
     else:
         print("No image provided, using dummy gray image")
         image = Image.new('RGB', (224, 224), color='gray')
@@ -66,17 +71,18 @@ def main():
 
     variants_generated = []
 
-    for i in range(args.variants):
-        # Vary temperature slightly for each variant
-        temp = args.temperature + (i * 0.1)
-        print(f"\n  Variant {i+1}/{args.variants} (temperature={temp:.2f})...")
+    # Vary temperature slightly for each variant; all variants decode in one batch
+    temperatures = [args.temperature + (i * 0.1) for i in range(args.variants)]
+    print("  Temperatures: " + ", ".join(f"{t:.2f}" for t in temperatures))
 
-        bt_xml = vlm.generate_bt(
-            image=image,
-            instruction=args.instruction,
-            max_new_tokens=1536
-        )
+    bt_xmls = vlm.generate_variants(
+        image=image,
+        instruction=args.instruction,
+        temperatures=temperatures,
+        max_new_tokens=1536
+    )
 
+    for i, bt_xml in enumerate(bt_xmls):
         # Save variant
         if args.variants == 1:
             variant_path = output_path
@@ -87,11 +93,9 @@ def main():
             f.write(bt_xml)
 
         variants_generated.append(variant_path)
+        print(f"  Variant {i+1}/{args.variants} (temperature={temperatures[i]:.2f})")
         print(f"    ✓ Saved to: {variant_path} ({len(bt_xml)} chars)")
 
-        # Update temperature for next variant
-        vlm.set_temperature(temp)
-
     print(f"\n✓ Generated {len(variants_generated)} BT variant(s)")
 
     # Show preview
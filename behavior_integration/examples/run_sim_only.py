@@ -48,9 +48,9 @@ def main():
         print(f"✗ BT file not found: {bt_path}")
         sys.exit(1)
     
-    with open(bt_path) as f:
-        bt_xml = f.read()
-    print(f"✓ BT loaded ({len(bt_xml)} chars)")
+    # Raw bytes go straight to the XML parser (no decode/re-encode round trip)
+    bt_xml = bt_path.read_bytes()
+    print(f"✓ BT loaded ({len(bt_xml)} bytes)")
     
     # Parse BT
     print("\n[2/4] Parsing BT...")
@@ -132,21 +132,32 @@ def main():
     success = False
     last_status = None
     
+    # Hoisted out of the tick loop
+    tick = bt_root.tick
+    SUCCESS = NodeStatus.SUCCESS
+    FAILURE = NodeStatus.FAILURE
+    PRINT_EVERY = 25
+    ticks_until_print = PRINT_EVERY
+    status_str = {s: f"{s.value:8s}" for s in NodeStatus}
+    
     try:
         while tick_count < args.max_ticks:
-            status = bt_root.tick(context)
+            status = tick(context)
             tick_count += 1
             
-            if status != last_status or tick_count % 25 == 0:
-                print(f"⏱️  Tick {tick_count:4d}: {status.value:8s}")
+            ticks_until_print -= 1
+            if status is not last_status or not ticks_until_print:
+                print(f"⏱️  Tick {tick_count:4d}: {status_str[status]}")
                 last_status = status
+            if not ticks_until_print:
+                ticks_until_print = PRINT_EVERY
             
-            if status == NodeStatus.SUCCESS:
+            if status is SUCCESS:
                 print(f"\n🎉 SUCCESS after {tick_count} ticks!")
                 success = True
                 break
             
-            if status == NodeStatus.FAILURE:
+            if status is FAILURE:
                 print(f"\n❌ FAILURE after {tick_count} ticks")
                 break
             
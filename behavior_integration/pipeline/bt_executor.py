@@ -144,6 +144,8 @@ class BTExecutor:
 
             tick_count = 0
             success = False
+            # Bound once: called every tick
+            capture_frame_if_due = video_recorder.capture_frame_if_due if video_recorder else None
 
             while tick_count < self.args.max_ticks:
                 if tick_count == 0:
@@ -161,8 +163,8 @@ class BTExecutor:
                 tick_count += 1
 
                 # VIDEO: Single capture clock (throttled by tick interval)
-                if video_recorder:
-                    video_recorder.capture_frame_if_due()
+                if capture_frame_if_due is not None:
+                    capture_frame_if_due()
 
                 # Always log first few ticks, then every 10
                 if tick_count <= 3 or tick_count % 10 == 0:
@@ -7,7 +7,7 @@ Orchestrates a single episode: capture, generate BT, execute.
 import time
 from pathlib import Path
 
-from behavior_integration.constants.task_mappings import TASK_OBJECT_MAPPINGS, GENERAL_KEYWORD_MAPPINGS
+from behavior_integration.constants.task_mappings import TASK_OBJECT_MAPPINGS, match_keywords
 
 
 class EpisodeRunner:
@@ -334,14 +334,13 @@ class EpisodeRunner:
 
         # Priority 2: General keyword matching
         instruction_lower = instruction.lower().replace('_', ' ')
-        for keyword, object_types in GENERAL_KEYWORD_MAPPINGS.items():
-            if keyword in instruction_lower:
-                for obj in scene_objects:
-                    obj_name = getattr(obj, 'name', '').lower()
-                    obj_category = getattr(obj, 'category', '').lower()
-                    for obj_type in object_types:
-                        if obj_type in obj_name or obj_type in obj_category:
-                            return obj
+        for keyword, object_types in match_keywords(instruction_lower):
+            for obj in scene_objects:
+                obj_name = getattr(obj, 'name', '').lower()
+                obj_category = getattr(obj, 'category', '').lower()
+                for obj_type in object_types:
+                    if obj_type in obj_name or obj_type in obj_category:
+                        return obj
 
         # Priority 3: Direct name matching (final fallback)
         words = instruction_lower.split()
@@ -44,7 +44,7 @@ except ImportError:
 
 import json
 
-from behavior_integration.constants.task_mappings import TASK_OBJECT_MAPPINGS, GENERAL_KEYWORD_MAPPINGS
+from behavior_integration.constants.task_mappings import TASK_OBJECT_MAPPINGS, match_keywords
 
 # Configuration paths (relative to project root)
 PROJECT_ROOT = Path(__file__).parent.parent.parent
@@ -1255,15 +1255,14 @@ class ContinuousPipeline:
         # Priority 4: General keyword matching
         if instruction:
             instruction_lower = instruction.lower().replace('_', ' ')
-            for keyword, object_types in GENERAL_KEYWORD_MAPPINGS.items():
-                if keyword in instruction_lower:
-                    for obj in scene_objects:
-                        obj_name = getattr(obj, 'name', '').lower()
-                        obj_category = getattr(obj, 'category', '').lower()
-                        for obj_type in object_types:
-                            if obj_type in obj_name or obj_type in obj_category:
-                                self.log(f"  ✓ Keyword mapping: '{keyword}' → '{obj.name}'")
-                                return obj
+            for keyword, object_types in match_keywords(instruction_lower):
+                for obj in scene_objects:
+                    obj_name = getattr(obj, 'name', '').lower()
+                    obj_category = getattr(obj, 'category', '').lower()
+                    for obj_type in object_types:
+                        if obj_type in obj_name or obj_type in obj_category:
+                            self.log(f"  ✓ Keyword mapping: '{keyword}' → '{obj.name}'")
+                            return obj
 
         # Priority 5: Direct name matching (final fallback)
         if instruction:
@@ -11,7 +11,7 @@ import numpy as np
 from pathlib import Path
 from PIL import Image
 
-from behavior_integration.constants.task_mappings import TASK_OBJECT_MAPPINGS, GENERAL_KEYWORD_MAPPINGS
+from behavior_integration.constants.task_mappings import TASK_OBJECT_MAPPINGS, match_keywords
 
 # Import BT_TEMPLATES and loaders for predefined BT selection
 try:
@@ -582,16 +582,15 @@ class InteractiveController:
 
         # Priority 2: General keyword matching
         self.log(f"  [DEBUG] Trying general keyword matching...")
-        for keyword, object_types in GENERAL_KEYWORD_MAPPINGS.items():
-            if keyword in instruction_lower:
-                self.log(f"  [DEBUG] Keyword '{keyword}' found, searching for: {object_types}")
-                for obj in scene_objects:
-                    obj_name = getattr(obj, 'name', '').lower()
-                    obj_category = getattr(obj, 'category', '').lower()
-                    for obj_type in object_types:
-                        if obj_type in obj_name or obj_type in obj_category:
-                            self.log(f"  [DEBUG] MATCH (keyword)! '{obj_type}' -> '{obj.name}'")
-                            return obj
+        for keyword, object_types in match_keywords(instruction_lower):
+            self.log(f"  [DEBUG] Keyword '{keyword}' found, searching for: {object_types}")
+            for obj in scene_objects:
+                obj_name = getattr(obj, 'name', '').lower()
+                obj_category = getattr(obj, 'category', '').lower()
+                for obj_type in object_types:
+                    if obj_type in obj_name or obj_type in obj_category:
+                        self.log(f"  [DEBUG] MATCH (keyword)! '{obj_type}' -> '{obj.name}'")
+                        return obj
 
         # Priority 3: Direct word matching (final fallback)
         words = instruction_lower.split()
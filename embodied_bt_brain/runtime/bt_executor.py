@@ -12,7 +12,7 @@ Implements a lightweight BT ticker that:
 
 import xml.etree.ElementTree as ET
 from enum import Enum
-from typing import Dict, List, Optional, Callable, Any
+from typing import Dict, List, Optional, Callable, Any, Union
 import time
 
 
@@ -495,8 +495,8 @@ class BehaviorTreeExecutor:
         root = tree.getroot()
         return self.parse_xml_element(root)
 
-    def parse_xml_string(self, xml_string: str) -> BTNode:
-        """Parse BehaviorTree.CPP XML string and return root node"""
+    def parse_xml_string(self, xml_string: Union[str, bytes]) -> BTNode:
+        """Parse BehaviorTree.CPP XML string (str, or raw bytes as read from disk) and return root node"""
         root = ET.fromstring(xml_string)
         return self.parse_xml_element(root)
 
@@ -615,14 +615,24 @@ class BehaviorTreeExecutor:
             self._substitute_params(node.expanded_tree, params)
 
     def print_tree(self, node: BTNode, indent: int = 0):
-        """Print tree structure for debugging"""
-        prefix = "  " * indent
-        params_str = ", ".join(f"{k}={v}" for k, v in node.params.items())
-        print(f"{prefix}{node} [{params_str}]")
+        """Print tree structure for debugging (iterative, one write for the whole tree)"""
+        lines = []
+        # Stack entries are (node, indent) or (preformatted line, None)
+        stack = [(node, indent)]
+        while stack:
+            node, indent = stack.pop()
+            if indent is None:
+                lines.append(node)
+                continue
 
-        for child in node.children:
-            self.print_tree(child, indent + 1)
+            prefix = "  " * indent
+            params_str = ", ".join(f"{k}={v}" for k, v in node.params.items())
+            lines.append(f"{prefix}{node} [{params_str}]")
 
-        if isinstance(node, SubTreeNode) and node.expanded_tree:
-            print(f"{prefix}  [Expanded:]")
-            self.print_tree(node.expanded_tree, indent + 2)
+            pending = [(child, indent + 1) for child in node.children]
+            if isinstance(node, SubTreeNode) and node.expanded_tree:
+                pending.append((f"{prefix}  [Expanded:]", None))
+                pending.append((node.expanded_tree, indent + 2))
+            stack.extend(reversed(pending))
+
+        print("\n".join(lines))
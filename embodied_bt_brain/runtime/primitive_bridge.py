@@ -745,15 +745,15 @@ class PALPrimitiveBridge:
                         if placement_map:
                             # Track used slots per object type (for multi-instance like half_apple)
                             used_slots = getattr(self, '_placement_slots_used', {})
+                            # Offsets are from AABB center (not existing-object centroid)
+                            aabb_cx = (c_min[0] + c_max[0]) / 2
+                            aabb_cy = (c_min[1] + c_max[1]) / 2
 
                             for pattern, positions in placement_map.items():
                                 if pattern in obj_name:
                                     slot_idx = used_slots.get(pattern, 0)
                                     if slot_idx < len(positions):
                                         ox, oy = positions[slot_idx]
-                                        # Offsets are from AABB center (not existing-object centroid)
-                                        aabb_cx = (c_min[0] + c_max[0]) / 2
-                                        aabb_cy = (c_min[1] + c_max[1]) / 2
                                         _add_candidate(aabb_cx + ox, aabb_cy + oy, f'map:{pattern}[{slot_idx}]', priority=0)
                                         used_slots[pattern] = slot_idx + 1
                                         self._placement_slots_used = used_slots
@@ -762,8 +762,6 @@ class PALPrimitiveBridge:
                                     # Also add remaining slots as backup
                                     for i in range(slot_idx + 1, len(positions)):
                                         ox2, oy2 = positions[i]
-                                        aabb_cx = (c_min[0] + c_max[0]) / 2
-                                        aabb_cy = (c_min[1] + c_max[1]) / 2
                                         _add_candidate(aabb_cx + ox2, aabb_cy + oy2, f'map:{pattern}[{i}]', priority=1)
                                     break
 
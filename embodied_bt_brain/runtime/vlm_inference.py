@@ -20,10 +20,27 @@ Usage:
 import torch
 import numpy as np
 from PIL import Image
-from typing import Union, Optional
+from typing import List, Union, Optional
 from pathlib import Path
 import os
 import tempfile
+import threading
+
+
+class _RowTemperature:
+    """Logits processor that divides each batch row by its own temperature."""
+
+    def __init__(self, temperatures: List[float]):
+        # Temperature 0 (greedy) is approximated by a very sharp distribution
+        self.temperatures = [max(t, 1e-5) for t in temperatures]
+        self._scale = None
+
+    def __call__(self, input_ids, scores):
+        if self._scale is None or self._scale.device != scores.device:
+            self._scale = torch.tensor(
+                self.temperatures, dtype=scores.dtype, device=scores.device
+            ).unsqueeze(1)
+        return scores / self._scale
 
 
 class VLMInference:
@@ -39,6 +56,9 @@ class VLMInference:
         "qwen25-vl-3b": "unsloth/Qwen2.5-VL-3B-Instruct",
     }
 
+    # Decoding stops as soon as the BT closes; nothing after it is used
+    STOP_STRINGS = ["</root>"]
+
     def __init__(
         self,
         model_type: str = "qwen3-vl-8b",
@@ -105,10 +125,22 @@ class VLMInference:
             self.processor = self.get_chat_template(self.processor, "gemma-3")
             self.tokenizer = self.processor.tokenizer if self.processor else None
 
+        # Warm up the processor (chat template, image preprocessing) while
+        # the LoRA adapter loads, so the first generate_bt doesn't pay for it
+        warmup = threading.Thread(target=self._warm_up_processor, daemon=True)
+        warmup.start()
+
         if self.lora_path:
             self.model = self.PeftModel.from_pretrained(self.model, self.lora_path)
 
         self.FastVisionModel.for_inference(self.model)
+        warmup.join()
+
+    def _warm_up_processor(self):
+        try:
+            self._tokenize(Image.new('RGB', (224, 224), color='gray'), "warm up")
+        except Exception as e:
+            print(f"[VLMInference] Processor warm-up skipped: {e}")
 
 
 
@@ -132,6 +164,42 @@ class VLMInference:
         Returns:
             BehaviorTree XML string
         """
+        encoded = self.encode_prompt(image, instruction, prompt_override=prompt_override)
+        return self.sample(
+            encoded,
+            max_new_tokens=max_new_tokens,
+            return_full_output=return_full_output
+        )
+
+    def encode_prompt(
+        self,
+        image: Union[np.ndarray, Image.Image, str],
+        instruction: str,
+        prompt_override: str = None
+    ):
+        """
+        Build and tokenize the chat prompt for an image/instruction pair.
+
+        The result can be passed to sample() any number of times, e.g. to
+        draw several variants at different temperatures from one encoding.
+
+        Args:
+            image: RGB image (numpy array, PIL Image, or file path)
+            instruction: Task instruction
+            prompt_override: Use this prompt instead of the default BT prompt
+
+        Returns:
+            Model inputs (input_ids, attention_mask, pixel_values, ...) on self.device
+        """
+        return self._tokenize(image, instruction, prompt_override).to(self.device)
+
+    def _tokenize(
+        self,
+        image: Union[np.ndarray, Image.Image, str],
+        instruction: str,
+        prompt_override: str = None
+    ):
+        """Build the chat prompt and run the processor/tokenizer (CPU tensors)."""
         # Convert image to PIL
         if isinstance(image, str):
             pil_image = Image.open(image).convert("RGB")
@@ -158,51 +226,76 @@ class VLMInference:
             ]
         }]
 
-        # Generate
         if self.model_type.startswith("qwen"):
             # Qwen3-VL format
             input_text = self.tokenizer.apply_chat_template(
                 messages, add_generation_prompt=True)
-            inputs = self.tokenizer(
+            return self.tokenizer(
                 pil_image,  # Image first!
                 input_text,  # Text second!
                 add_special_tokens=False,
                 return_tensors="pt"
-            ).to(self.device)
-
-            # Generation params for Qwen
-            gen_kwargs = {
-                "max_new_tokens": max_new_tokens,
-                "temperature": self.temperature,
-                "min_p": 0.1,
-                "use_cache": True,
-                "do_sample": True if self.temperature > 0 else False,
-                "pad_token_id": self.tokenizer.pad_token_id
-            }
+            )
         else:
             # Gemma format
             input_text = self.processor.apply_chat_template(
                 messages, add_generation_prompt=True)
-            inputs = self.processor(
+            return self.processor(
                 text=input_text,
                 images=pil_image,
                 add_special_tokens=False,
                 return_tensors="pt"
-            ).to(self.device)
+            )
+
+    def sample(
+        self,
+        encoded,
+        temperature: Optional[float] = None,
+        max_new_tokens: int = 1536,
+        return_full_output: bool = False
+    ) -> str:
+        """
+        Generate from inputs prepared by encode_prompt().
+
+        Args:
+            encoded: Output of encode_prompt()
+            temperature: Sampling temperature (defaults to self.temperature)
+            max_new_tokens: Maximum tokens to generate
+            return_full_output: If True, return full model output; if False, extract only XML
+
+        Returns:
+            BehaviorTree XML string
+        """
+        if temperature is None:
+            temperature = self.temperature
 
+        if self.model_type.startswith("qwen"):
+            # Generation params for Qwen
+            gen_kwargs = {
+                "max_new_tokens": max_new_tokens,
+                "temperature": temperature,
+                "min_p": 0.1,
+                "use_cache": True,
+                "do_sample": True if temperature > 0 else False,
+                "pad_token_id": self.tokenizer.pad_token_id
+            }
+        else:
             # Generation params for Gemma
             gen_kwargs = {
                 "max_new_tokens": max_new_tokens,
-                "temperature": self.temperature,
+                "temperature": temperature,
                 "top_p": 0.95,
                 "top_k": 64,
                 "do_sample": True,
                 "pad_token_id": self.processor.tokenizer.pad_token_id
             }
 
+        tokenizer = self.tokenizer if self.model_type.startswith("qwen") else self.processor.tokenizer
+        gen_kwargs.update(stop_strings=self.STOP_STRINGS, tokenizer=tokenizer)
+
         # Generate
         with torch.no_grad():
-            outputs = self.model.generate(**inputs, **gen_kwargs)
+            outputs = self.model.generate(**encoded, **gen_kwargs)
 
         # Decode
         if self.model_type.startswith("qwen"):
@@ -218,6 +311,67 @@ class VLMInference:
         else:
             return self._extract_xml(result)
 
+    def generate_variants(
+        self,
+        image: Union[np.ndarray, Image.Image, str],
+        instruction: str,
+        temperatures: List[float],
+        max_new_tokens: int = 1536,
+        return_full_output: bool = False
+    ) -> List[str]:
+        """
+        Generate one BT per temperature in a single batched generate() call.
+
+        The encoded prompt is tiled once per temperature and each row's logits
+        are scaled by its own temperature, so variant i is sampled at
+        temperatures[i] while decoding runs as one batch.
+
+        Args:
+            image: RGB image (numpy array, PIL Image, or file path)
+            instruction: Task instruction
+            temperatures: Sampling temperature for each variant
+            max_new_tokens: Maximum tokens to generate
+            return_full_output: If True, return full model output; if False, extract only XML
+
+        Returns:
+            List of BehaviorTree XML strings, one per temperature
+        """
+        encoded = self.encode_prompt(image, instruction)
+        if len(temperatures) == 1:
+            return [self.sample(encoded, temperature=temperatures[0], max_new_tokens=max_new_tokens,
+                                return_full_output=return_full_output)]
+
+        from transformers import LogitsProcessorList
+
+        n = len(temperatures)
+        batch = {
+            k: torch.cat([v] * n) if isinstance(v, torch.Tensor) else v
+            for k, v in encoded.items()
+        }
+
+        tokenizer = self.tokenizer if self.model_type.startswith("qwen") else self.processor.tokenizer
+        gen_kwargs = {
+            "max_new_tokens": max_new_tokens,
+            "temperature": 1.0,  # per-row temperature applied by _RowTemperature
+            "do_sample": True,
+            "pad_token_id": tokenizer.pad_token_id,
+            "logits_processor": LogitsProcessorList([_RowTemperature(temperatures)]),
+            "stop_strings": self.STOP_STRINGS,
+            "tokenizer": tokenizer,
+        }
+        if self.model_type.startswith("qwen"):
+            gen_kwargs.update(min_p=0.1, use_cache=True)
+        else:
+            gen_kwargs.update(top_p=0.95, top_k=64)
+
+        with torch.no_grad():
+            outputs = self.model.generate(**batch, **gen_kwargs)
+
+        results = tokenizer.batch_decode(outputs, skip_special_tokens=True)
+        if return_full_output:
+            return results
+        return [self._extract_xml(result) for result in results]
+
     def _build_prompt(self, instruction: str) -> str:
         """Build prompt for BT generation"""
         # This matches the training prompt format